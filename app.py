@@ -1,9 +1,15 @@
 """Main dashboard application for WhatsApp conversation processor."""
 
+import io
 import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from typing import Optional
 
+import numpy as np
+import pandas as pd
 import streamlit as st
+from packaging.version import Version
 
 # ─── START COMPREHENSIVE DEBUG LOGGING ─────────────────────────────────
 from services.debug_logger import start_debug_logging, debug_log
@@ -15,13 +21,20 @@ from utils.ui_helpers import parse_imoveis
 from services.preloader import start_background_preload, display_preloader_status
 
 # Import centralized phone utilities
-from services.phone_utils import format_phone_for_display as format_phone_display
+from services.phone_utils import format_phones_for_display
+
+# st.fragment reruns only part of the page (experimental_fragment on older releases)
+st_fragment = getattr(st, "fragment", None) or getattr(st, "experimental_fragment", None)
+# Fragments may only write to st.sidebar from Streamlit 1.37 on
+sidebar_fragment = (
+    st_fragment if Version(st.__version__) >= Version("1.37.0") else None
+)
 
 # ─── PAGE CONFIG ─────────────────────────────────────────────────────────
 st.set_page_config(page_title="Home Dashboard", layout="wide")
 
 # ─── MESSAGE LISTENER FOR MAP NAVIGATION ─────────────────────────────────
-st.markdown("""
+MESSAGE_LISTENER_JS = """
 <script>
 // Listen for messages from map popups
 window.addEventListener('message', function(event) {
@@ -36,7 +49,12 @@ window.addEventListener('message', function(event) {
     }
 });
 </script>
-""", unsafe_allow_html=True)
+"""
+
+# Emitted on every run: elements a rerun doesn't re-send are removed from the
+# page. It sits before any conditional output, so its position (and identity)
+# never changes and the frontend keeps the unchanged element as is.
+st.markdown(MESSAGE_LISTENER_JS, unsafe_allow_html=True)
 
 st.title("🏠 Home Dashboard")
 
@@ -54,6 +72,19 @@ display_preloader_status()
 
 
 # ─── LOAD & CACHE DATA ────────────────────────────────────────────────────
+# Text columns stored as string[pyarrow] in master_df
+ARROW_STRING_COLS = (
+    "whatsapp_number",
+    "IMOVEIS",
+    "display_name",
+    "expected_name",
+    "classificacao",
+    "intencao",
+    "pagamento",
+    "resposta",
+)
+
+
 @st.cache_data
 def load_master_df():
 
@@ -64,6 +95,18 @@ def load_master_df():
         df["sheet_synced"] = False
     if "whatsapp_sent" not in df.columns:
         df["whatsapp_sent"] = False
+
+    # Arrow-backed storage: no PyObject per cell and faster .str operations.
+    # Missing strings become "" so `value or default` checks never meet pd.NA
+    for col in ARROW_STRING_COLS:
+        if col in df.columns and pd.api.types.infer_dtype(df[col], skipna=True) == "string":
+            df[col] = df[col].fillna("").astype("string[pyarrow]")
+    for col in ("sheet_synced", "whatsapp_sent"):
+        if pd.api.types.infer_dtype(df[col], skipna=False) == "boolean":
+            df[col] = df[col].astype("bool[pyarrow]")
+
+    # Positional row id used by the grid; materialized once per data version
+    df["_idx"] = np.arange(len(df), dtype=np.int32)
     return df
 
 
@@ -71,8 +114,9 @@ def load_master_df():
 if "master_df" not in st.session_state:
     st.session_state.master_df = load_master_df()
 
-# Work on the master_df
-df = st.session_state.master_df.copy()
+# Work on the master_df by reference: this script never mutates it, derived
+# display columns are built in a separate frame below
+df = st.session_state.master_df
 
 # Load Spreadsheet button 
 if st.sidebar.button("📥 Load Spreadsheet", help="Force fresh spreadsheet data load for other pages (Conversations, Processor)"):
@@ -101,17 +145,19 @@ if st.sidebar.button("📥 Load Spreadsheet", help="Force fresh spreadsheet data
 # Debug info
 if DEBUG:
     st.sidebar.subheader("Debug Info")
-    st.sidebar.write(f"Total records: {len(df)}")
-    st.sidebar.write(f"Available columns: {list(df.columns)}")
+    # One element for all debug values instead of one per line
+    debug_info = {"total_records": len(df), "columns": list(df.columns)}
     if "original_values" in st.session_state:
-        st.sidebar.write(f"Modified records: {len(st.session_state.get('original_values', {}))}")
+        debug_info["modified_records"] = len(st.session_state.get("original_values", {}))
+    st.sidebar.json(debug_info, expanded=False)
 
 
 # ─── TRANSFORM COLUMNS ─────────────────────────────────────────────────────
 # 1) Phone formatting: (XX) XXXXX-XXXX
-def format_brazilian_phone(raw: str) -> str:
-    # Use centralized phone utility for consistent behavior
-    return format_phone_display(raw)
+def format_brazilian_phone(raw: pd.Series) -> pd.Series:
+    # Vectorized over the whole column; same output as the centralized
+    # per-phone utility, without a Python call per row
+    return format_phones_for_display(raw)
 
 
 # 2) Extract addresses from IMOVEIS
@@ -126,12 +172,56 @@ def extract_addresses(imoveis_raw):
         return ""
 
 
-# Apply transformations
-df["phone"] = df["whatsapp_number"].apply(format_brazilian_phone) if "whatsapp_number" in df.columns else ""
-df["ENDERECO"] = df["IMOVEIS"].apply(extract_addresses) if "IMOVEIS" in df.columns else ""
+def extract_addresses_column(values: list) -> list:
+    """extract_addresses over a column, parsing and joining each distinct IMOVEIS string once."""
+    by_text = {}
+    addresses = []
+    for raw in values:
+        if isinstance(raw, str):
+            address = by_text.get(raw)
+            if address is None:
+                address = by_text[raw] = extract_addresses(raw)
+        else:
+            address = extract_addresses(raw)
+        addresses.append(address)
+    return addresses
+
+
+def hash_pandas_content(obj) -> bytes:
+    """Full-content cache key; st.cache_data only samples frames over 50k rows."""
+    try:
+        hashes = pd.util.hash_pandas_object(obj, index=False)
+    except TypeError:
+        # Unhashable cells (lists/dicts in IMOVEIS) hash by their text form
+        hashes = pd.util.hash_pandas_object(obj.astype(str), index=False)
+    return hashes.to_numpy().tobytes()
+
+
+@st.cache_data(
+    show_spinner=False,
+    max_entries=2,
+    hash_funcs={
+        pd.Series: hash_pandas_content,
+        pd.Index: hash_pandas_content,
+        pd.RangeIndex: hash_pandas_content,
+    },
+)
+def build_derived_columns(
+    index: pd.Index, phones: Optional[pd.Series], imoveis: Optional[pd.Series]
+) -> pd.DataFrame:
+    """Build phone/ENDERECO once per distinct source data instead of on every rerun."""
+    # Absent source columns skip the transform entirely and display as ""
+    phone = format_brazilian_phone(phones) if phones is not None else ""
+    addresses = extract_addresses_column(imoveis.tolist()) if imoveis is not None else ""
+    return pd.DataFrame({"phone": phone, "ENDERECO": addresses}, index=index)
+
+
+# Apply transformations; the source columns are passed as-is (no slice copy)
+# and only the previous data version is kept alongside the current one
+derived = build_derived_columns(df.index, df.get("whatsapp_number"), df.get("IMOVEIS"))
 
 # ─── SELECT & VALIDATE COLUMNS ─────────────────────────────────────────────
-display_cols = [
+DISPLAY_COLS_TEMPLATE = (
     "phone",
     "ENDERECO",
     "display_name",
@@ -143,30 +233,29 @@ display_cols = [
     "inventario_flag",
     "resposta",
     "sheet_synced",
-]
+)
+
+
 # Keep only columns that exist
-display_cols = [c for c in display_cols if c in df.columns]
+display_cols = [
+    c for c in DISPLAY_COLS_TEMPLATE if c in derived.columns or c in df.columns
+]
 
 # ─── BUILD GRID DATAFRAME ─────────────────────────────────────────────────
-# Add index
-if "_idx" not in df.columns:
-    df["_idx"] = df.index
-
-grid_cols = ["_idx", *display_cols]
-grid_df = df[grid_cols].copy()
+# Displayed master columns; they are sliced per page below, so the grid never
+# copies all N rows of master_df
+master_cols = [c for c in display_cols if c not in derived.columns]
 
 # ─── SHOW MODIFICATIONS STATUS ─────────────────────────────────────────────
 if "original_values" in st.session_state and st.session_state["original_values"]:
-    modified_records = []
-    for idx, original in st.session_state["original_values"].items():
-        current = st.session_state.master_df.iloc[idx]
-        has_changes = False
-        for field, orig_value in original.items():
-            if field in current and current[field] != orig_value:
-                has_changes = True
-                break
-        if has_changes:
-            modified_records.append(idx)
+    # One array comparison over records x fields instead of a Python loop with .iloc per record
+    orig_df = pd.DataFrame.from_dict(st.session_state["original_values"], orient="index")
+    orig_df = orig_df[[c for c in orig_df.columns if c in df.columns]]
+    current = df.iloc[orig_df.index.tolist()][orig_df.columns]
+    # Missing values become None so both-missing compares equal and NA never reaches bool()
+    current = current.astype(object).where(current.notna(), None)
+    changed = (current.to_numpy() != orig_df.astype(object).to_numpy()) & orig_df.notna().to_numpy()
+    modified_records = orig_df.index[changed.any(axis=1)].tolist()
 
     if modified_records:
         st.info(
@@ -174,22 +263,72 @@ if "original_values" in st.session_state and st.session_state["original_values"]
         )
 
 # ─── RENDER GRID ──────────────────────────────────────────────────────────
+# Only one page of rows is serialized and sent to the browser per rerun
+GRID_PAGE_SIZE = 200
+
+
+def change_grid_page(step: int):
+    """Move the grid window by step pages (bounds are enforced on render)."""
+    st.session_state.grid_page = st.session_state.get("grid_page", 0) + step
+
+
+page_count = max(1, -(-len(df) // GRID_PAGE_SIZE))
+st.session_state.grid_page = min(max(st.session_state.get("grid_page", 0), 0), page_count - 1)
+page_start = st.session_state.grid_page * GRID_PAGE_SIZE
+page_rows = slice(page_start, page_start + GRID_PAGE_SIZE)
+# Row slices are views; only the page's rows of the selected columns are copied
+page_master = df.iloc[page_rows]
+if "_idx" in df.columns:
+    page_idx = page_master["_idx"]
+else:
+    # master_df was loaded by another page, without load_master_df's _idx
+    page_idx = pd.Series(
+        np.arange(len(df), dtype=np.int32)[page_rows], index=page_master.index, name="_idx"
+    )
+page_df = pd.concat([page_idx, derived.iloc[page_rows], page_master[master_cols]], axis=1)
+
 # Display the dataframe with clickable rows
 event = st.dataframe(
-    grid_df,
+    page_df,
     hide_index=True,
     use_container_width=True,
     on_select="rerun",
     selection_mode="single-row",
 )
 
+page_prev_col, page_info_col, page_next_col = st.columns([1, 2, 1])
+with page_prev_col:
+    st.button(
+        "⬅️ Previous",
+        key="grid_prev_page",
+        disabled=st.session_state.grid_page == 0,
+        on_click=change_grid_page,
+        args=(-1,),
+        use_container_width=True,
+    )
+with page_info_col:
+    st.caption(
+        f"Page {st.session_state.grid_page + 1}/{page_count} "
+        f"({len(df)} records)"
+    )
+with page_next_col:
+    st.button(
+        "Next ➡️",
+        key="grid_next_page",
+        disabled=st.session_state.grid_page >= page_count - 1,
+        on_click=change_grid_page,
+        args=(1,),
+        use_container_width=True,
+    )
+
 # Handle row selection to navigate to processor
 if hasattr(event, "selection") and event.selection and event.selection.get("rows"):
     selected_row_idx = event.selection["rows"][0]
-    if selected_row_idx < len(grid_df):
-        actual_idx = int(grid_df.iloc[selected_row_idx]["_idx"])
-        # Get conversation_id for URL parameter
-        conversation_id = df.iloc[actual_idx].get('conversation_id', df.iloc[actual_idx].get('whatsapp_number', ''))
+    if selected_row_idx < len(page_df):
+        actual_idx = int(page_df["_idx"].iat[selected_row_idx])
+        # Get conversation_id for URL parameter (one row lookup, not one per field)
+        selected_row = df.iloc[actual_idx]
+        conversation_id = selected_row.get('conversation_id', selected_row.get('whatsapp_number', ''))
         st.session_state.selected_idx = actual_idx
         # Store conversation_id for URL update after navigation
         if conversation_id:
@@ -197,6 +336,70 @@ if hasattr(event, "selection") and event.selection and event.selection.get("rows
         st.switch_page("pages/Processor.py")
 
 # ─── BULK ACTIONS ─────────────────────────────────────────────────────────
+EXPORT_FILE_TYPES = {
+    "CSV": ("csv", "text/csv"),
+    "Parquet": ("parquet", "application/vnd.apache.parquet"),
+}
+
+
+EXPORT_POLL_SECONDS = 1
+
+
+def export_master_df(data: pd.DataFrame, export_format: str) -> bytes:
+    """Serialize the master table (runs on the export worker thread)."""
+    data = data.drop(columns="_idx", errors="ignore")  # internal grid row id
+    if export_format == "Parquet":
+        # Columnar + zstd: much smaller and faster to write than CSV
+        buffer = io.BytesIO()
+        data.to_parquet(buffer, engine="pyarrow", compression="zstd", index=False)
+        return buffer.getvalue()
+    return data.to_csv(index=False).encode("utf-8")
+
+
+@st.cache_resource
+def get_export_executor() -> ThreadPoolExecutor:
+    """One export worker shared by all sessions (exports queue up)."""
+    return ThreadPoolExecutor(max_workers=1, thread_name_prefix="export")
+
+
+def clear_export_job():
+    """Drop the finished export, and its payload, from the session."""
+    st.session_state.pop("export_job", None)
+
+
+def render_export_status(polling: bool = False):
+    """Show the running export, or its download button once the worker is done."""
+    job = st.session_state.get("export_job")
+    if not job:
+        return
+    future, export_format, timestamp = job
+    if not future.done():
+        st.info(f"⏳ Preparing {export_format} export...")
+        if st_fragment is None and st.button("🔄 Check export", key="check_export"):
+            st.rerun()
+        return
+    if polling:
+        # Stop the timer: one full rerun renders the download button once
+        st.rerun()
+    try:
+        data = future.result()
+    except Exception as e:
+        st.error(f"❌ Error exporting {export_format}: {e}")
+        st.button("✖ Dismiss", key="dismiss_export", on_click=clear_export_job)
+        return
+    extension, mime = EXPORT_FILE_TYPES[export_format]
+    # Serving or dismissing the file clears the job, so its bytes are not
+    # kept in session_state and re-registered on every later rerun
+    st.download_button(
+        label=f"Download {export_format}",
+        data=data,
+        file_name=f"whatsapp_data_{timestamp}.{extension}",
+        mime=mime,
+        on_click=clear_export_job,
+    )
+    st.button("✖ Dismiss", key="dismiss_export", on_click=clear_export_job)
+
+
 st.subheader("Bulk Actions")
 bulk_col1, bulk_col2, bulk_col3 = st.columns(3)
 
@@ -209,88 +412,107 @@ with bulk_col2:
     st.write("")  # Empty space where reload button was
 
 with bulk_col3:
-    export_format = st.selectbox("Export format", ["CSV", "Excel"], key="export_format")
+    export_format = st.selectbox("Export format", ["CSV", "Parquet", "Excel"], key="export_format")
     if st.button("📊 Export Current State"):
-        if export_format == "CSV":
-            csv = st.session_state.master_df.to_csv(index=False)
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            st.download_button(
-                label="Download CSV",
-                data=csv,
-                file_name=f"whatsapp_data_{timestamp}.csv",
-                mime="text/csv",
+        if export_format in EXPORT_FILE_TYPES:
+            # Serialize on a worker thread so the script thread isn't blocked by
+            # to_csv/to_parquet on the whole table; snapshot the frame because
+            # the Processor page edits master_df in place
+            st.session_state.export_job = (
+                get_export_executor().submit(
+                    export_master_df, st.session_state.master_df.copy(), export_format
+                ),
+                export_format,
+                datetime.now().strftime("%Y%m%d_%H%M%S"),
             )
         else:
             # Excel export would be implemented here
             st.info("Excel export would be implemented here")
 
+    export_job = st.session_state.get("export_job")
+    if export_job and not export_job[0].done() and st_fragment is not None:
+        # Poll only this panel until the worker finishes
+        st_fragment(run_every=EXPORT_POLL_SECONDS)(render_export_status)(polling=True)
+    else:
+        render_export_status()
+
 # Record Actions section removed - now handled by clicking rows in the dataframe
 st.write(
     "💡 **Tip:** Click on any row in the table above to open the processor for that record."
 )
 
 # ─── BACKGROUND OPERATIONS SIDEBAR ─────────────────────────────────────────
-# Sync global background operations to session state for UI updates
+# Fragments rerun only the operations panel on a timer instead of the whole
+# dashboard; versions before 1.37 fall back to rate-limited full reruns.
+OPS_REFRESH_SECONDS = 3
+
+def render_operations_status():
+    """Sync background operations and render their status in the sidebar."""
+    try:
+        global_storage.sync_to_session_state()
+    except Exception as e:
+        # Only show error in sidebar if debug mode is enabled (check session state)
+        if st.session_state.get("debug_mode", False):
+            st.sidebar.error(f"Error syncing background operations: {e}")
+
+    try:
+        # Update pending operations first (polls Cloudflare Workers for status)
+        update_pending_operations()
+
+        # Show new event-driven operations (archive, etc.)
+        event_render_operations_sidebar()
+
+        # Show legacy background operations (sync, etc.)
+        render_operations_sidebar()
+    except Exception as e:
+        st.sidebar.error(f"Error displaying operations status: {e}")
+
+
+def poll_operations_status():
+    """Fragment body: refresh the panel, then rerun the app once work is done."""
+    render_operations_status()
+    if not get_running_operations() and not get_pending_operations():
+        # Stop polling and let the dashboard pick up the finished results
+        st.rerun()
+
 try:
     import time
     from services.background_operations import global_storage, get_running_operations, render_operations_sidebar
-    from services.event_driven_operations import render_operations_sidebar as event_render_operations_sidebar, update_pending_operations
-    
-    global_storage.sync_to_session_state()
-    
-    # Auto-refresh with rate limiting if there are running operations
+    from services.event_driven_operations import (
+        render_operations_sidebar as event_render_operations_sidebar,
+        update_pending_operations,
+        get_pending_operations,
+    )
+
+    # Both read the live operation stores; the session-state sync happens
+    # once per (full or fragment) run inside render_operations_status
     running_ops = get_running_operations()
-    if running_ops:
-        # Rate-limited refresh: only refresh every few seconds when operations are running
-        current_time = time.time()
-        last_refresh_key = "last_bg_ops_refresh_dashboard"
-        
-        if last_refresh_key not in st.session_state:
-            st.session_state[last_refresh_key] = 0
-        
-        # Refresh every 3 seconds when operations are running
-        if current_time - st.session_state[last_refresh_key] > 3.0:
-            st.session_state[last_refresh_key] = current_time
-            st.rerun()
-        
+    pending_ops = get_pending_operations()
 except Exception as e:
-    # Only show error in sidebar if debug mode is enabled (check session state)
+    running_ops, pending_ops = [], []
     if st.session_state.get("debug_mode", False):
-        st.sidebar.error(f"Error syncing background operations: {e}")
-
-# Render operations status in sidebar
-try:
-    # Update pending operations first (polls Cloudflare Workers for status)
-    update_pending_operations()
-    
-    # Show new event-driven operations (archive, etc.)
-    event_render_operations_sidebar()
-    
-    # Show legacy background operations (sync, etc.)
-    render_operations_sidebar()
-    
-    # Auto-refresh if there are pending operations
-    from services.event_driven_operations import get_pending_operations
-    pending_ops = get_pending_operations()
-    if pending_ops:
-        # Auto-refresh every 2 seconds when operations are running
-        import time
+        st.sidebar.error(f"Error loading background operations: {e}")
+
+if (running_ops or pending_ops) and sidebar_fragment is not None:
+    # Only the fragment re-executes every few seconds; the grid, derived
+    # columns and Arrow serialization above are left untouched. It is only
+    # registered while operations are in flight.
+    sidebar_fragment(run_every=OPS_REFRESH_SECONDS)(poll_operations_status)()
+else:
+    render_operations_status()
+
+    if running_ops or pending_ops:
+        # Rate-limited full refresh when fragments are unavailable
+        current_time = time.time()
         if 'last_operations_refresh' not in st.session_state:
             st.session_state.last_operations_refresh = 0
-        
-        current_time = time.time()
+
         time_since_last_refresh = current_time - st.session_state.last_operations_refresh
-        
-        # Show countdown in sidebar for user feedback
-        refresh_interval = 2.0  # 2 seconds
-        if time_since_last_refresh >= refresh_interval:
+        if time_since_last_refresh >= OPS_REFRESH_SECONDS:
             st.session_state.last_operations_refresh = current_time
-            print(f"🔄 AUTO-REFRESH: Updating {len(pending_ops)} pending operations")
+            print(f"🔄 AUTO-REFRESH: Updating {len(running_ops) + len(pending_ops)} operations")
             st.rerun()
         else:
             # Show countdown
-            remaining = refresh_interval - time_since_last_refresh
+            remaining = OPS_REFRESH_SECONDS - time_since_last_refresh
             st.sidebar.caption(f"🔄 Auto-refresh in {remaining:.1f}s")
-    
-except Exception as e:
-    st.sidebar.error(f"Error displaying operations status: {e}")
@@ -18,6 +18,7 @@ from services.preloader import start_background_preload, display_preloader_statu
 
 # Import centralized phone utilities
 from services.phone_utils import format_phone_for_display as format_phone_display
+from utils.ui_helpers import format_last_message_time
 
 # Page config
 st.set_page_config(page_title="Conversations", layout="wide")
@@ -1359,53 +1360,8 @@ try:
 
         # 6. Last Message Timestamp (formatted)
         if "last_message_datetime_brt" in filtered_df.columns:
-            # Format timestamp to '08/Aug 14h35m22s' format
-            def format_timestamp(timestamp_str):
-                if not timestamp_str or pd.isna(timestamp_str) or timestamp_str == '':
-                    return ''
-                try:
-                    # Parse different possible datetime formats
-                    from datetime import datetime
-                    import re
-                    
-                    # Clean the timestamp string
-                    clean_timestamp = str(timestamp_str).strip()
-                    if not clean_timestamp:
-                        return ''
-                    
-                    # Try different parsing formats
-                    formats_to_try = [
-                        "%Y-%m-%d %H:%M:%S",    # 2024-08-08 14:35:22
-                        "%d/%m/%Y %H:%M:%S",    # 08/08/2024 14:35:22
-                        "%Y-%m-%dT%H:%M:%S",    # 2024-08-08T14:35:22
-                        "%d/%m/%y %H:%M:%S",    # 08/08/24 14:35:22
-                    ]
-                    
-                    dt = None
-                    for fmt in formats_to_try:
-                        try:
-                            dt = datetime.strptime(clean_timestamp, fmt)
-                            break
-                        except ValueError:
-                            continue
-                    
-                    if dt is None:
-                        return clean_timestamp  # Return original if can't parse
-                    
-                    # Format to requested format: '08/Aug 14h35m22s'
-                    month_names = {
-                        1: 'Jan', 2: 'Feb', 3: 'Mar', 4: 'Apr', 5: 'May', 6: 'Jun',
-                        7: 'Jul', 8: 'Aug', 9: 'Sep', 10: 'Oct', 11: 'Nov', 12: 'Dec'
-                    }
-                    
-                    formatted = f"{dt.day:02d}/{month_names[dt.month]} {dt.hour:02d}h{dt.minute:02d}m{dt.second:02d}s"
-                    return formatted
-                    
-                except Exception:
-                    return str(timestamp_str)  # Return original if error
-            
             # Apply formatting to create new column
-            filtered_df["formatted_timestamp"] = filtered_df["last_message_datetime_brt"].apply(format_timestamp)
+            filtered_df["formatted_timestamp"] = filtered_df["last_message_datetime_brt"].apply(format_last_message_time)
             display_columns.append("formatted_timestamp")
             display_column_names.append("Last Message Time")
 
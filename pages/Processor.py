@@ -2,7 +2,9 @@
 
 import os
 import time
+from collections import OrderedDict
 from datetime import datetime
+from functools import lru_cache
 
 import pandas as pd
 import streamlit as st
@@ -49,6 +51,7 @@ from utils.ui_helpers import (
     build_highlights,
     fmt_num,
     highlight,
+    highlight_pattern,
     parse_chat,
     parse_familiares_grouped,
     parse_imoveis,
@@ -64,6 +67,67 @@ from utils.sync_ui import (
 from services.conversation_sync import get_sync_status
 
 
+# ─── FORM OPTIONS ───────────────────────────────────────────────────────────
+# Selectbox option sequences built once at import, not on every form rerun
+PRESET_KEYS = tuple(PRESET_RESPONSES)
+STATUS_URBLINK_SELECT_OPTS = ("",) + tuple(STATUS_URBLINK_OPTS)
+PERCEPCAO_SELECT_OPTS = ("",) + tuple(PERCEPCAO_OPTS)
+
+
+def option_index_map(options) -> dict:
+    """Map each option to its first position, as list.index would."""
+    index_map = {}
+    for i, option in enumerate(options):
+        index_map.setdefault(option, i)
+    return index_map
+
+
+# Selectbox defaults become one dict lookup instead of `in` + .index scans
+CLASSIFICACAO_INDEX = option_index_map(CLASSIFICACAO_OPTS)
+INTENCAO_INDEX = option_index_map(INTENCAO_OPTS)
+STATUS_URBLINK_INDEX = option_index_map(STATUS_URBLINK_SELECT_OPTS)
+PERCEPCAO_INDEX = option_index_map(PERCEPCAO_SELECT_OPTS)
+
+# ─── CHAT DISPLAY CONSTANTS ─────────────────────────────────────────────────
+# Only the most recent messages are rendered; older ones load on request
+CHAT_WINDOW = 50
+
+# Timestamp layouts tried for each chat message, in order
+CHAT_TIMESTAMP_FORMATS = (
+    "%d/%m/%Y %H:%M",  # 25/06/2025 15:30
+    "%Y-%m-%d %H:%M",  # 2025-06-25 15:30
+    "%d/%m/%Y %H:%M:%S",  # 25/06/2025 15:30:45
+    "%Y-%m-%d %H:%M:%S",  # 2025-06-25 15:30:45
+    "%H:%M",  # 15:30 (time only)
+    "%d/%m %H:%M",  # 25/06 15:30 (no year)
+)
+
+# Portuguese month and weekday names for date headers
+MONTHS_PT = {
+    1: "Janeiro",
+    2: "Fevereiro",
+    3: "Março",
+    4: "Abril",
+    5: "Maio",
+    6: "Junho",
+    7: "Julho",
+    8: "Agosto",
+    9: "Setembro",
+    10: "Outubro",
+    11: "Novembro",
+    12: "Dezembro",
+}
+WEEKDAYS_PT = {
+    0: "Segunda-feira",
+    1: "Terça-feira",
+    2: "Quarta-feira",
+    3: "Quinta-feira",
+    4: "Sexta-feira",
+    5: "Sábado",
+    6: "Domingo",
+}
+
+
 # ──────────────────────────────────────────────────────────────────────────────
 # PHONE NUMBER FORMATTING FUNCTION
 # ──────────────────────────────────────────────────────────────────────────────
@@ -613,6 +677,37 @@ def find_conversations_with_same_property(
         )
 
 
+RELATED_PROPERTY_CACHE_SIZE = 256
+
+
+def has_related_property_conversations(address, neighborhood, conversation_id=None):
+    """
+    Whether find_conversations_with_same_property finds anything, remembered
+    per session: the scan covers every conversation and used to run for each
+    listed property on every rerun. The scan skips the row the property modal
+    was opened from, so that index is part of the key; reloads and syncs call
+    clear_related_property_cache.
+    """
+    cache = st.session_state.setdefault("_related_property_cache", OrderedDict())
+    modal_data = st.session_state.get("property_modal_data") or {}
+    key = (address, neighborhood, conversation_id, modal_data.get("current_idx"))
+    if key in cache:
+        cache.move_to_end(key)
+        return cache[key]
+    has_related = not find_conversations_with_same_property(
+        address, neighborhood, conversation_id
+    ).empty
+    cache[key] = has_related
+    if len(cache) > RELATED_PROPERTY_CACHE_SIZE:
+        cache.popitem(last=False)
+    return has_related
+
+
+def clear_related_property_cache():
+    """Forget remembered related-property results after the data changes."""
+    st.session_state.pop("_related_property_cache", None)
+
+
 # ─── PAGE CONFIG (MUST BE FIRST) ────────────────────────────────────────
 st.set_page_config(page_title="Processador de Conversas", page_icon="📱", layout="wide")
 
@@ -624,8 +719,7 @@ if "preloader_started" not in st.session_state:
 
 # ─── PROPERTY ASSIGNMENT SESSION STATE INITIALIZATION ──────────────────────
 # Initialize property assignment session state early to prevent errors
-if "show_property_assignment" not in st.session_state:
-    st.session_state.show_property_assignment = False
+st.session_state.setdefault("show_property_assignment", False)
 if "property_assignment_state" not in st.session_state:
     st.session_state.property_assignment_state = {
         "bairro_filter": [],
@@ -818,11 +912,105 @@ DEV = True  # Set based on your environment
 
 
 # ─── DATA LOADER ────────────────────────────────────────────────────────────
-@st.cache_data(ttl=300)  # Cache for 5 minutes
+@st.cache_data(ttl=300, max_entries=2)  # Cache for 5 minutes, one entry per flag value
 def load_data(force_load_spreadsheet: bool = False):
     """Load the WhatsApp conversations DataFrame with Google Sheets data - same as Conversations page."""
     from loaders.db_loader import get_conversations_with_sheets_data
-    return get_conversations_with_sheets_data(force_load_spreadsheet=force_load_spreadsheet)
+    df = get_conversations_with_sheets_data(force_load_spreadsheet=force_load_spreadsheet)
+    # Normalize odd column name once per load instead of on every rerun
+    if "OBITO PROVAVEL" in df.columns and "OBITO_PROVAVEL" not in df.columns:
+        df = df.rename(columns={"OBITO PROVAVEL": "OBITO_PROVAVEL"})
+    return df
+
+
+# ─── FORM HELPER FUNCTIONS ─────────────────────────────────────────────────
+# Fields whose database values store_original_values compares edits against
+ORIGINAL_VALUE_FIELDS = (
+    "classificacao",
+    "intencao",
+    "acoes_urblink",
+    "status_urblink",
+    "pagamento",
+    "percepcao_valor_esperado",
+    "razao_standby",
+    "resposta",
+    "obs",
+    "stakeholder",
+    "intermediador",
+    "inventario_flag",
+    "standby",
+    "followup_date",
+)
+
+
+def snapshot_original_db_data(frame: pd.DataFrame) -> pd.DataFrame:
+    """Copy only the tracked form fields: a full second frame per session isn't needed."""
+    return frame[[c for c in ORIGINAL_VALUE_FIELDS if c in frame.columns]].copy()
+
+
+@lru_cache(maxsize=1024)
+def _split_csv_text(value_str: str) -> tuple:
+    """Split a comma-separated string once per distinct value (e.g. pagamento)."""
+    return tuple(v.strip() for v in value_str.split(",") if v.strip())
+
+
+def safe_split_csv(value):
+    """Safely split a value into a list, handling various data types."""
+    if value is None or pd.isna(value):
+        return []
+    return list(_split_csv_text(str(value).strip()))
+
+
+# ─── PROPERTY CARD HELPERS ─────────────────────────────────────────────────
+def format_fraction_percent(fraction) -> str:
+    """Render a fração ideal (0-1 share or percentage) as "NN%"."""
+    try:
+        value = float(fraction)
+        return f"{int(round(value * 100 if value <= 1 else value))}%"
+    except (ValueError, TypeError):
+        return str(fraction) if fraction else "N/A"
+
+
+def build_property_cards(imoveis) -> list:
+    """
+    Normalize imoveis into (address, neighborhood, card_html) tuples, so the
+    render loop only lays out columns and buttons.
+    """
+    cards = []
+    for item in imoveis:
+        if not isinstance(item, dict):
+            continue
+
+        # Handle both old format (AREA TERRENO) and new format (area_terreno)
+        area_terreno = item.get("area_terreno") or item.get("AREA TERRENO", "?")
+        area_construcao = item.get("area_construcao") or item.get("AREA CONSTRUCAO", "?")
+        fraction = item.get("fracao_ideal") or item.get("FRACAO IDEAL", "")
+        build_type = (
+            item.get("tipo_construtivo")
+            or item.get("TIPO CONSTRUTIVO", "").strip()
+        )
+        address = item.get("endereco") or item.get("ENDERECO", "?")
+        neighborhood = item.get("bairro") or item.get("BAIRRO", "?")
+        indice_cadastral = item.get("indice_cadastral") or item.get("INDICE CADASTRAL", "")
+
+        area_terreno_text = fmt_num(area_terreno) if area_terreno else "?"
+        area_construcao_text = fmt_num(area_construcao) if area_construcao else "?"
+        fraction_percent = format_fraction_percent(fraction)
+
+        # Build optional parts separately to avoid nested f-string issues
+        build_type_part = f" | <em>{build_type}</em>" if build_type else ""
+        fraction_part = f" | Fração: {fraction_percent}" if fraction_percent != "N/A" else ""
+        cadastral_part = f"<br><small style='color: #666;'>Cadastro: {indice_cadastral}</small>" if indice_cadastral else ""
+
+        card_html = f"""
+                        <div style="margin-bottom: 10px; padding: 8px; border-left: 3px solid #007bff; background-color: #f8f9fa; border-radius: 4px;">
+                            <strong>{address}, {neighborhood}</strong><br>
+                            <small>Terreno: {area_terreno_text} m² | Construção: {area_construcao_text} m²{build_type_part}{fraction_part}</small>
+                            {cadastral_part}
+                        </div>
+                        """
+        cards.append((address, neighborhood, card_html))
+    return cards
 
 
 # ─── CONVERSATION DISPLAY HELPER FUNCTIONS ─────────────────────────────────
@@ -852,37 +1040,10 @@ def format_date_header(timestamp):
         elif msg_date == today - timedelta(days=1):
             return "Ontem"
         else:
-            # Portuguese month names
-            months_pt = {
-                1: "Janeiro",
-                2: "Fevereiro",
-                3: "Março",
-                4: "Abril",
-                5: "Maio",
-                6: "Junho",
-                7: "Julho",
-                8: "Agosto",
-                9: "Setembro",
-                10: "Outubro",
-                11: "Novembro",
-                12: "Dezembro",
-            }
-
-            # Portuguese weekday names
-            weekdays_pt = {
-                0: "Segunda-feira",
-                1: "Terça-feira",
-                2: "Quarta-feira",
-                3: "Quinta-feira",
-                4: "Sexta-feira",
-                5: "Sábado",
-                6: "Domingo",
-            }
-
             day = dt.day
-            month = months_pt[dt.month]
+            month = MONTHS_PT[dt.month]
             year = dt.year
-            weekday = weekdays_pt[dt.weekday()]
+            weekday = WEEKDAYS_PT[dt.weekday()]
 
             return f"{day} {month}, {year} - {weekday}"
     except:
@@ -1047,6 +1208,7 @@ def initialize_session_state():
 
         # Create a dataframe with this single conversation
         st.session_state.master_df = pd.DataFrame([mapped_data])
+        clear_related_property_cache()
 
         # Initialize display format for follow-up date if it exists
         if mapped_data.get("followup_date"):
@@ -1072,7 +1234,7 @@ def initialize_session_state():
                 pass  # If date format is invalid, just skip
 
         # Also set as original data
-        st.session_state.original_db_data = st.session_state.master_df.copy()
+        st.session_state.original_db_data = snapshot_original_db_data(st.session_state.master_df)
 
         # Clear the conversation data from session state so it doesn't persist
         del st.session_state.processor_conversation_data
@@ -1082,17 +1244,26 @@ def initialize_session_state():
     else:
         # Normal initialization - load from deepseek_results with error handling
         try:
+            freshly_loaded = False
             if "master_df" not in st.session_state:
                 st.session_state.master_df = load_data()
+                clear_related_property_cache()
+                freshly_loaded = True
             # CRITICAL FIX: Always ensure spreadsheet data is merged on fresh loads
             # This fixes the regression where navigation loses spreadsheet data
             elif len(st.session_state.master_df) > 0 and 'Nome' not in st.session_state.master_df.columns:
                 print("⚠️ REGRESSION FIX: master_df missing spreadsheet data, reloading...")
                 st.session_state.master_df = load_data(force_load_spreadsheet=False)
+                clear_related_property_cache()
+                freshly_loaded = True
 
             # Initialize original_db_data (store the original database values)
             if "original_db_data" not in st.session_state:
-                st.session_state.original_db_data = load_data()
+                # An untouched fresh load is the same data: an in-memory copy is
+                # much cheaper than deserializing the cached frame a second time
+                st.session_state.original_db_data = snapshot_original_db_data(
+                    st.session_state.master_df if freshly_loaded else load_data()
+                )
         except Exception as e:
             st.error(f"🚨 **PRODUCTION ERROR - Data Loading Failed**")
             st.error(f"**Error:** {str(e)}")
@@ -1114,8 +1285,7 @@ def initialize_session_state():
             st.stop()
 
     # Initialize original_values storage
-    if "original_values" not in st.session_state:
-        st.session_state.original_values = {}
+    st.session_state.setdefault("original_values", {})
 
     # Ensure all required columns exist in master_df
     required_columns = {
@@ -1215,13 +1385,25 @@ def store_original_values(idx, row):
         }
 
 
+def set_master_value(idx, field, value):
+    """
+    Write one cell of master_df. The home page stores some columns with
+    typed dtypes (string[pyarrow], bool[pyarrow]) that reject None, NaN or
+    non-str values, so the column is cast to object before the write.
+    """
+    master_df = st.session_state.master_df
+    if field in master_df.columns and master_df[field].dtype != "object":
+        master_df[field] = master_df[field].astype("object")
+    master_df.at[idx, field] = value
+
+
 def reset_to_original(idx):
     """Reset all fields to original AI values."""
     if idx in st.session_state.original_values:
         original = st.session_state.original_values[idx]
         for field, value in original.items():
             if field in st.session_state.master_df.columns:
-                st.session_state.master_df.at[idx, field] = value
+                set_master_value(idx, field, value)
         # Also clear any widget state for this record
         widget_keys = [
             f"classificacao_select_{idx}",
@@ -1269,13 +1451,8 @@ def update_field(idx, field, value):
         else:
             st.session_state.master_df[field] = [""] * len(st.session_state.master_df)
 
-    # Convert column to object dtype if necessary to avoid dtype warnings
-    if st.session_state.master_df[field].dtype != "object":
-        st.session_state.master_df[field] = st.session_state.master_df[field].astype(
-            "object"
-        )
-
-    st.session_state.master_df.at[idx, field] = value
+    # Casts typed columns to object first to avoid dtype errors/warnings
+    set_master_value(idx, field, value)
 
 
 def compare_values(original, current):
@@ -1450,6 +1627,7 @@ if ("processor_navigation_context" in st.session_state and
         
         # Replace the master_df with just this conversation for display
         st.session_state.master_df = conversation_copy
+        clear_related_property_cache()
         df = st.session_state.master_df  # Update our local reference
         st.session_state.idx = 0  # Always index 0 since we have just one row
         
@@ -1532,15 +1710,15 @@ elif auto_load_target:
                 st.exception(e)
                 
         # Don't stop the app, just use default index
-        if "idx" not in st.session_state:
-            st.session_state.idx = 0
+        st.session_state.setdefault("idx", 0)
 
 # Ensure idx is within bounds
 st.session_state.idx = min(st.session_state.idx, len(df) - 1)
 idx = st.session_state.idx
 
-# Get current row
-row = df.iloc[idx]
+# Get current row as a plain dict: it is read ~90 times per rerun and dict
+# lookups skip the per-access Series dispatch and boxing
+row = df.iloc[idx].to_dict()
 
 # Handle pending conversation_id from navigation
 if "pending_conversation_id" in st.session_state:
@@ -1558,11 +1736,6 @@ elif not auto_load_conversation:
 # Store original values for this record
 store_original_values(idx, row)
 
-# Normalize odd column name
-if "OBITO PROVAVEL" in df.columns and "OBITO_PROVAVEL" not in df.columns:
-    df = df.rename(columns={"OBITO PROVAVEL": "OBITO_PROVAVEL"})
-    st.session_state.master_df = df
-
 # ─── HEADER & PROGRESS ──────────────────────────────────────────────────────
 _, progress_col, _ = st.columns([1, 2, 1])
 with progress_col:
@@ -1589,11 +1762,10 @@ with progress_col:
         # Original behavior when not coming from Conversations page
         st.progress((idx + 1) / len(df))
         st.caption(f"{idx + 1}/{len(df)} mensagens processadas")
-st.markdown("<div style='margin-top:12px'></div>", unsafe_allow_html=True)
-
 # Dashboard navigation moved to bottom
 
-st.markdown("<div style='margin-top:12px'></div>", unsafe_allow_html=True)
+# One spacer element between the progress header and the navigation row
+st.markdown("<div style='margin-top:24px'></div>", unsafe_allow_html=True)
 
 
 # ─── NAVIGATION TOP ─────────────────────────────────────────────────────────
@@ -1931,6 +2103,7 @@ if conversation_id:
     
     # Check for sync updates and refresh if needed (only when auto-sync is enabled)
     if st.session_state.get('auto_sync_enabled', False) and check_for_sync_updates(conversation_id):
+        clear_related_property_cache()
         st.rerun()
     
     
@@ -2026,7 +2199,7 @@ with chat_container.container():
             st.write(f"- **Row index:** {idx}")
             st.write(f"- **DataFrame shape:** {df.shape}")
         
-        if "conversation_id" in row.index and pd.notna(conversation_id):
+        if "conversation_id" in row and pd.notna(conversation_id):
             try:
                 if DEBUG:
                     st.write(f"⏳ Attempting to load messages for conversation: {conversation_id}")
@@ -2037,26 +2210,33 @@ with chat_container.container():
                     st.write(f"✅ Messages loaded successfully. Shape: {messages_df.shape if not messages_df.empty else 'Empty DataFrame'}")
                 
                 if not messages_df.empty:
-                    # Convert database messages to the expected format
-                    for msg_idx, msg_row in messages_df.iterrows():
+                    # Convert database messages to the expected format, walking
+                    # plain column lists instead of building a Series per message
+                    def message_column(name, default):
+                        if name in messages_df.columns:
+                            return messages_df[name].tolist()
+                        return [default] * len(messages_df)
+
+                    contact_name = row.get("display_name", "Contact")
+                    for msg_idx, from_me, message_text, timestamp in zip(
+                        messages_df.index,
+                        message_column("from_me", False),
+                        message_column("message_text", ""),
+                        message_column("timestamp", 0),
+                    ):
                         try:
-                            sender = (
-                                "Urb.Link"
-                                if msg_row.get("from_me", False)
-                                else row.get("display_name", "Contact")
-                            )
                             messages.append(
                                 {
-                                    "sender": sender,
-                                    "msg": msg_row.get("message_text", ""),
-                                    "ts": datetime.fromtimestamp(
-                                        msg_row.get("timestamp", 0)
-                                    ).strftime("%d/%m/%Y %H:%M"),
+                                    "sender": "Urb.Link" if from_me else contact_name,
+                                    "msg": message_text,
+                                    "ts": datetime.fromtimestamp(timestamp).strftime(
+                                        "%d/%m/%Y %H:%M"
+                                    ),
                                 }
                             )
                         except Exception as msg_error:
                             st.error(f"❌ **Error processing message {msg_idx}:** {str(msg_error)}")
-                            st.write(f"**Message data:** {dict(msg_row)}")
+                            st.write(f"**Message data:** {messages_df.loc[msg_idx].to_dict()}")
                             if DEBUG:
                                 st.exception(msg_error)
                             
@@ -2084,7 +2264,7 @@ with chat_container.container():
         # If no messages from database, fall back to parsed conversation history
         if (
             not messages
-            and "conversation_history" in row.index
+            and "conversation_history" in row
             and pd.notna(row.get("conversation_history"))
             and row.get("conversation_history")
         ):
@@ -2094,160 +2274,155 @@ with chat_container.container():
             messages = []
 
         if messages:
-            # Build complete HTML like in the old Processor page, but with WhatsApp styling
-            chat_html = "<div style='height: 840px; overflow-y: auto; border: 1px solid #ddd; padding: 10px; border-radius: 5px; background-color: #f9f9f9;'>"
-
-            # Display messages in WhatsApp style with date headers
-            last_date = None
-
-            for msg in messages:
-                # Parse the timestamp to get date
-                dt = None
-                try:
-                    # Try to parse different timestamp formats
-                    timestamp_str = msg["ts"].strip()
-
-                    # Debug: let's see what format we're dealing with
-                    if DEBUG:
-                        print(f"DEBUG: Parsing timestamp: '{timestamp_str}'")
-
-                    # Try various common formats
-                    formats_to_try = [
-                        "%d/%m/%Y %H:%M",  # 25/06/2025 15:30
-                        "%Y-%m-%d %H:%M",  # 2025-06-25 15:30
-                        "%d/%m/%Y %H:%M:%S",  # 25/06/2025 15:30:45
-                        "%Y-%m-%d %H:%M:%S",  # 2025-06-25 15:30:45
-                        "%H:%M",  # 15:30 (time only)
-                        "%d/%m %H:%M",  # 25/06 15:30 (no year)
-                    ]
-
-                    for fmt in formats_to_try:
-                        try:
-                            dt = datetime.strptime(timestamp_str, fmt)
-                            if fmt == "%H:%M":
-                                # If only time, assume today
-                                dt = dt.replace(
-                                    year=datetime.now().year,
-                                    month=datetime.now().month,
-                                    day=datetime.now().day,
-                                )
-                            elif fmt == "%d/%m %H:%M":
-                                # If no year, assume current year
-                                dt = dt.replace(year=datetime.now().year)
-                            break
-                        except ValueError:
-                            continue
-
-                    if dt:
-                        current_date = dt.date()
-
-                        # Check if we need a date header
-                        if last_date != current_date:
-                            # Create date header in format "25 de Junho, 2025 (Terça-Feira)"
-                            today = datetime.now().date()
-                            from datetime import timedelta
-
-                            if current_date == today:
-                                date_header = "Hoje"
-                            elif current_date == today - timedelta(days=1):
-                                date_header = "Ontem"
-                            else:
-                                # Portuguese month names
-                                months_pt = {
-                                    1: "Janeiro",
-                                    2: "Fevereiro",
-                                    3: "Março",
-                                    4: "Abril",
-                                    5: "Maio",
-                                    6: "Junho",
-                                    7: "Julho",
-                                    8: "Agosto",
-                                    9: "Setembro",
-                                    10: "Outubro",
-                                    11: "Novembro",
-                                    12: "Dezembro",
-                                }
+            # Long threads render only the last CHAT_WINDOW messages
+            older_count = max(len(messages) - CHAT_WINDOW, 0)
+            show_older = False
+            if older_count:
+                # Fixed label and a per-conversation key: a new message changes
+                # older_count, and must not give the toggle a new identity
+                show_older = st.toggle(
+                    "Mostrar mensagens anteriores",
+                    key=f"show_older_{conversation_id}",
+                )
+                if not show_older:
+                    st.caption(f"{older_count} mensagens anteriores ocultas")
+                    messages = messages[-CHAT_WINDOW:]
+
+            # Widget reruns (typing, toggles) re-render the same conversation:
+            # reuse its HTML instead of re-parsing timestamps and rebuilding it
+            chat_cache_key = (
+                idx,
+                conversation_id,
+                datetime.now().date(),  # "Hoje"/"Ontem" headers depend on it
+                show_older,
+                hash(tuple((m["ts"], m["sender"], m["msg"]) for m in messages)),
+            )
+            cached_chat = st.session_state.get("_chat_html_cache")
+            if cached_chat and cached_chat[0] == chat_cache_key:
+                chat_html = cached_chat[1]
+            else:
+                # Build complete HTML like in the old Processor page, but with WhatsApp styling
+                chat_parts = ["<div style='height: 840px; overflow-y: auto; border: 1px solid #ddd; padding: 10px; border-radius: 5px; background-color: #f9f9f9;'>"]
 
-                                # Portuguese weekday names
-                                weekdays_pt = {
-                                    0: "Segunda-feira",
-                                    1: "Terça-feira",
-                                    2: "Quarta-feira",
-                                    3: "Quinta-feira",
-                                    4: "Sexta-feira",
-                                    5: "Sábado",
-                                    6: "Domingo",
-                                }
+                # Display messages in WhatsApp style with date headers
+                last_date = None
 
-                                day = dt.day
-                                month = months_pt[dt.month]
-                                year = dt.year
-                                weekday = weekdays_pt[dt.weekday()]
+                for msg in messages:
+                    # Parse the timestamp to get date
+                    dt = None
+                    try:
+                        # Try to parse different timestamp formats
+                        timestamp_str = msg["ts"].strip()
+
+                        # Debug: let's see what format we're dealing with
+                        if DEBUG:
+                            print(f"DEBUG: Parsing timestamp: '{timestamp_str}'")
+
+                        # Try various common formats
+                        for fmt in CHAT_TIMESTAMP_FORMATS:
+                            try:
+                                dt = datetime.strptime(timestamp_str, fmt)
+                                if fmt == "%H:%M":
+                                    # If only time, assume today
+                                    dt = dt.replace(
+                                        year=datetime.now().year,
+                                        month=datetime.now().month,
+                                        day=datetime.now().day,
+                                    )
+                                elif fmt == "%d/%m %H:%M":
+                                    # If no year, assume current year
+                                    dt = dt.replace(year=datetime.now().year)
+                                break
+                            except ValueError:
+                                continue
+
+                        if dt:
+                            current_date = dt.date()
+
+                            # Check if we need a date header
+                            if last_date != current_date:
+                                # Create date header in format "25 de Junho, 2025 (Terça-Feira)"
+                                today = datetime.now().date()
+                                from datetime import timedelta
+
+                                if current_date == today:
+                                    date_header = "Hoje"
+                                elif current_date == today - timedelta(days=1):
+                                    date_header = "Ontem"
+                                else:
+                                    day = dt.day
+                                    month = MONTHS_PT[dt.month]
+                                    year = dt.year
+                                    weekday = WEEKDAYS_PT[dt.weekday()]
 
-                                # Format: "25 de Junho, 2025 (Terça-Feira)"
-                                date_header = f"{day} de {month}, {year} ({weekday})"
+                                    # Format: "25 de Junho, 2025 (Terça-Feira)"
+                                    date_header = f"{day} de {month}, {year} ({weekday})"
 
-                            # Add date header to HTML
-                            chat_html += f'<div style="text-align: center; margin: 20px 0 10px 0;"><span style="background-color: #e0e0e0; padding: 5px 15px; border-radius: 15px; font-size: 12px; color: #666;">{date_header}</span></div>'
-                            last_date = current_date
+                                # Add date header to HTML
+                                chat_parts.append(f'<div style="text-align: center; margin: 20px 0 10px 0;"><span style="background-color: #e0e0e0; padding: 5px 15px; border-radius: 15px; font-size: 12px; color: #666;">{date_header}</span></div>')
+                                last_date = current_date
 
-                        # Format message time (only HH:MM in BRT)
-                        msg_time = dt.strftime("%H:%M")
-                    else:
-                        # If all parsing fails, extract time manually
-                        if ":" in timestamp_str:
-                            time_part = (
-                                timestamp_str.split()[-1]
-                                if " " in timestamp_str
-                                else timestamp_str
-                            )
-                            if ":" in time_part:
-                                msg_time = time_part[:5]  # Get only HH:MM
+                            # Format message time (only HH:MM in BRT)
+                            msg_time = dt.strftime("%H:%M")
+                        else:
+                            # If all parsing fails, extract time manually
+                            if ":" in timestamp_str:
+                                time_part = (
+                                    timestamp_str.split()[-1]
+                                    if " " in timestamp_str
+                                    else timestamp_str
+                                )
+                                if ":" in time_part:
+                                    msg_time = time_part[:5]  # Get only HH:MM
+                                else:
+                                    msg_time = timestamp_str
                             else:
                                 msg_time = timestamp_str
-                        else:
-                            msg_time = timestamp_str
 
-                except Exception as e:
-                    # If timestamp parsing fails completely, use original
-                    if DEBUG:
-                        print(f"DEBUG: Timestamp parsing failed: {e}")
-                    msg_time = msg["ts"]
+                    except Exception as e:
+                        # If timestamp parsing fails completely, use original
+                        if DEBUG:
+                            print(f"DEBUG: Timestamp parsing failed: {e}")
+                        msg_time = msg["ts"]
 
-                # Determine if message is from business or contact
-                is_from_me = msg["sender"] in ("Urb.Link", "Athos")
+                    # Determine if message is from business or contact
+                    is_from_me = msg["sender"] in ("Urb.Link", "Athos")
 
-                # Process the message text but DON'T escape HTML tags (we want <strong> to work)
-                clean_msg = bold_asterisks(msg["msg"])
-                clean_time = msg_time
-
-                # DEBUG: Let's see what we're actually working with
-                if DEBUG:
-                    print(f"DEBUG: Message content: '{msg['msg']}'")
-                    print(f"DEBUG: Message length: {len(msg['msg'])}")
-                    print(f"DEBUG: Clean message: '{clean_msg}'")
-                    print(f"DEBUG: Clean message length: {len(clean_msg)}")
-
-                # Create message container (WhatsApp style) - using the original approach
-                if is_from_me:
-                    # Message from the business/user (right side, green-ish)
-                    chat_html += f"""<div style="display: flex; justify-content: flex-end; margin: 2px 0; width: 100%;">
-                        <div style="background-color: #dcf8c6; padding: 8px 12px; border-radius: 18px; max-width: 400px; min-width: 120px; display: inline-block;">
-                            <div style="display: inline-block; max-width: 100%;">{clean_msg}</div>
-                            <div style="font-size: 11px; color: #666; text-align: right; margin-top: 2px;">{clean_time}</div>
-                        </div>
-                    </div>"""
-                else:
-                    # Message from contact (left side, white/light gray)
-                    chat_html += f"""<div style="display: flex; justify-content: flex-start; margin: 2px 0; width: 100%;">
-                        <div style="background-color: #ffffff; padding: 8px 12px; border-radius: 18px; max-width: 400px; min-width: 120px; border: 1px solid #e0e0e0; display: inline-block;">
-                            <div style="display: inline-block; max-width: 100%;">{clean_msg}</div>
-                            <div style="font-size: 11px; color: #666; text-align: right; margin-top: 2px;">{clean_time}</div>
-                        </div>
-                    </div>"""
+                    # Process the message text but DON'T escape HTML tags (we want <strong> to work)
+                    clean_msg = bold_asterisks(msg["msg"])
+                    clean_time = msg_time
 
-            # Close the scrollable container
-            chat_html += "</div>"
+                    # DEBUG: Let's see what we're actually working with
+                    if DEBUG:
+                        print(f"DEBUG: Message content: '{msg['msg']}'")
+                        print(f"DEBUG: Message length: {len(msg['msg'])}")
+                        print(f"DEBUG: Clean message: '{clean_msg}'")
+                        print(f"DEBUG: Clean message length: {len(clean_msg)}")
+
+                    # Create message container (WhatsApp style) - using the original approach.
+                    # content-visibility lets the browser skip layout/paint for bubbles
+                    # scrolled out of the chat box (native list virtualization)
+                    if is_from_me:
+                        # Message from the business/user (right side, green-ish)
+                        chat_parts.append(f"""<div style="display: flex; justify-content: flex-end; margin: 2px 0; width: 100%; content-visibility: auto; contain-intrinsic-size: auto 58px;">
+                            <div style="background-color: #dcf8c6; padding: 8px 12px; border-radius: 18px; max-width: 400px; min-width: 120px; display: inline-block;">
+                                <div style="display: inline-block; max-width: 100%;">{clean_msg}</div>
+                                <div style="font-size: 11px; color: #666; text-align: right; margin-top: 2px;">{clean_time}</div>
+                            </div>
+                        </div>""")
+                    else:
+                        # Message from contact (left side, white/light gray)
+                        chat_parts.append(f"""<div style="display: flex; justify-content: flex-start; margin: 2px 0; width: 100%; content-visibility: auto; contain-intrinsic-size: auto 58px;">
+                            <div style="background-color: #ffffff; padding: 8px 12px; border-radius: 18px; max-width: 400px; min-width: 120px; border: 1px solid #e0e0e0; display: inline-block;">
+                                <div style="display: inline-block; max-width: 100%;">{clean_msg}</div>
+                                <div style="font-size: 11px; color: #666; text-align: right; margin-top: 2px;">{clean_time}</div>
+                            </div>
+                        </div>""")
+
+                # Close the scrollable container
+                chat_parts.append("</div>")
+                chat_html = "".join(chat_parts)
+                st.session_state["_chat_html_cache"] = (chat_cache_key, chat_html)
 
             # Display the complete chat HTML (same approach as original Processor)
             st.markdown(chat_html, unsafe_allow_html=True)
@@ -2276,7 +2451,7 @@ with classification_container.container():
         # Presets dropdown (smaller section)
         preset_selected = st.selectbox(
             "Respostas Prontas",
-            options=list(PRESET_RESPONSES.keys()),
+            options=PRESET_KEYS,
             format_func=lambda tag: tag or "-- selecione uma resposta pronta --",
             key=f"preset_key_{idx}",  # Unique key per record
         )
@@ -2315,11 +2490,7 @@ with classification_container.container():
         # Classificação - Fix field mapping to use correct spreadsheet column
         current_classificacao = row.get("Classificação do dono do número", "") or row.get("classificacao", "")
         print(f"🔍 TERMINAL DEBUG: Widget loading - classificacao from row: {repr(current_classificacao)}")  # Terminal debug
-        classificacao_index = (
-            CLASSIFICACAO_OPTS.index(current_classificacao)
-            if current_classificacao in CLASSIFICACAO_OPTS
-            else 0
-        )
+        classificacao_index = CLASSIFICACAO_INDEX.get(current_classificacao, 0)
         classificacao_sel = st.selectbox(
             "🏷️ Classificação",
             CLASSIFICACAO_OPTS,
@@ -2332,11 +2503,7 @@ with classification_container.container():
     
         # Intenção - Fix field mapping to use correct spreadsheet column
         current_intencao = row.get("status_manual", "") or row.get("intencao", "")
-        intencao_index = (
-            INTENCAO_OPTS.index(current_intencao)
-            if current_intencao in INTENCAO_OPTS
-            else 0
-        )
+        intencao_index = INTENCAO_INDEX.get(current_intencao, 0)
         intencao_sel = st.selectbox(
             "🔍 Intenção",
             INTENCAO_OPTS,
@@ -2377,11 +2544,9 @@ with classification_container.container():
         )
     
         # Status Urb.Link
-        status_opts = [""] + STATUS_URBLINK_OPTS
+        status_opts = STATUS_URBLINK_SELECT_OPTS
         current_status = row.get("status_urblink", "")
-        status_index = (
-            status_opts.index(current_status) if current_status in status_opts else 0
-        )
+        status_index = STATUS_URBLINK_INDEX.get(current_status, 0)
     
         def on_status_change():
             new_value = st.session_state[f"status_select_{idx}"]
@@ -2396,16 +2561,6 @@ with classification_container.container():
             on_change=on_status_change,
         )
     
-        # Helper function to safely split comma-separated values
-        def safe_split_csv(value):
-            """Safely split a value into a list, handling various data types."""
-            if pd.isna(value) or value is None:
-                return []
-            value_str = str(value).strip()
-            return (
-                [v.strip() for v in value_str.split(",") if v.strip()] if value_str else []
-            )
-    
         # Forma de Pagamento
         current_pagamento = row.get("pagamento", "")
         pag_default = safe_split_csv(current_pagamento)
@@ -2420,13 +2575,9 @@ with classification_container.container():
         )
     
         # Percepção de Valor
-        percepcao_opts = [""] + PERCEPCAO_OPTS
+        percepcao_opts = PERCEPCAO_SELECT_OPTS
         current_percepcao = row.get("percepcao_valor_esperado", "")
-        percepcao_index = (
-            percepcao_opts.index(current_percepcao)
-            if current_percepcao in percepcao_opts
-            else 0
-        )
+        percepcao_index = PERCEPCAO_INDEX.get(current_percepcao, 0)
         percepcao_sel = st.selectbox(
             "💎 Percepção de Valor",
             percepcao_opts,
@@ -2894,7 +3045,14 @@ with classification_container.container():
 # ─── PRIORITY 3: CONTACT INFO (Load last, slower due to images) ─────────────────
 with contact_container.container():
     # ─── CONTACT SECTION ────────────────────────────────────────────────────────
-    hl_words = build_highlights(row.get("display_name", ""), row.get("expected_name", ""))
+    # Highlighting is off by default: skip building the name pattern then
+    hl_pattern = (
+        highlight_pattern(
+            build_highlights(row.get("display_name", ""), row.get("expected_name", ""))
+        )
+        if HIGHLIGHT_ENABLE
+        else None
+    )
 
     # Create contact info HTML with fixed height
     picture = row.get("PictureUrl")
@@ -2936,14 +3094,14 @@ with contact_container.container():
         print(f"🖼️ Image Debug: {picture_debug}")
 
     display_name = (
-        highlight(row.get("display_name", ""), hl_words)
+        highlight(row.get("display_name", ""), hl_pattern)
         if HIGHLIGHT_ENABLE
         else row.get("display_name", "")
     )
     # CRITICAL FIX: Use "Nome" field from spreadsheet merge for Nome Esperado
     nome_value = row.get("Nome", "")
     nome_str = str(nome_value) if pd.notna(nome_value) else ""
-    expected_name = highlight(nome_str, hl_words) if nome_str.strip() else highlight(row.get("expected_name", ""), hl_words)
+    expected_name = highlight(nome_str, hl_pattern) if nome_str.strip() else highlight(row.get("expected_name", ""), hl_pattern)
     # Try to get familiares data from the dedicated familiares spreadsheet
     familiares_raw = row.get("familiares", "")
     
@@ -2960,7 +3118,12 @@ with contact_container.container():
             if phone and not pd.isna(phone) and str(phone).strip():
                 familiares_raw = get_familiares_by_phone(str(phone).strip())
     
-    familiares_list = parse_familiares_grouped(familiares_raw)
+    # Skip the parser (and the list markup) entirely when there is nothing to parse
+    familiares_list = (
+        parse_familiares_grouped(familiares_raw)
+        if isinstance(familiares_raw, str) and familiares_raw.strip()
+        else []
+    )
     age = row.get("IDADE")
     age_text = ""
     if pd.notna(age) and str(age).strip() and str(age).strip() != "":
@@ -2978,9 +3141,13 @@ with contact_container.container():
     formatted_phone = format_phone_for_display(raw_phone)
 
     # Build familiares HTML
-    familiares_html = ""
-    for card in familiares_list:
-        familiares_html += f"<li>{card}</li>"
+    familiares_html = (
+        '<ul style="margin: 5px 0; padding-left: 20px;">'
+        + "".join(f"<li>{card}</li>" for card in familiares_list)
+        + "</ul>"
+        if familiares_list
+        else ""
+    )
 
     # Build picture HTML with simple error handling
     if picture:
@@ -3031,7 +3198,7 @@ with contact_container.container():
                 </div>
                 <div>
                     <strong>Familiares:</strong><br>
-                    <ul style="margin: 5px 0; padding-left: 20px;">{familiares_html}</ul>
+                    {familiares_html}
                 </div>
             </div>
         </div>
@@ -3278,9 +3445,6 @@ with contact_container.container():
 
         # Create a bordered container using native streamlit
         with st.container():
-            # Add the custom CSS class
-            st.markdown('<div class="imoveis-container">', unsafe_allow_html=True)
-
             # Check for assigned properties
             assigned_property = None
             if "assigned_properties" in st.session_state and conversation_id in st.session_state.assigned_properties:
@@ -3290,16 +3454,21 @@ with contact_container.container():
             if assigned_property:
                 st.markdown("#### 🎯 Propriedade Atribuída")
                 with st.expander("Propriedade Selecionada", expanded=True):
+                    # One markdown element per column instead of one per field
                     col1, col2 = st.columns(2)
                     with col1:
-                        st.write(f"**Bairro:** {assigned_property.get('BAIRRO', 'N/A')}")
-                        st.write(f"**Logradouro:** {assigned_property.get('NOME LOGRADOURO', 'N/A')}")
-                        st.write(f"**Endereço:** {assigned_property.get('ENDERECO', 'N/A')}")
+                        st.markdown("\n\n".join([
+                            f"**Bairro:** {assigned_property.get('BAIRRO', 'N/A')}",
+                            f"**Logradouro:** {assigned_property.get('NOME LOGRADOURO', 'N/A')}",
+                            f"**Endereço:** {assigned_property.get('ENDERECO', 'N/A')}",
+                        ]))
                     with col2:
-                        st.write(f"**Tipo:** {assigned_property.get('TIPO CONSTRUTIVO', 'N/A')}")
-                        st.write(f"**Área Terreno:** {assigned_property.get('AREA TERRENO', 'N/A')}")
-                        st.write(f"**Área Construção:** {assigned_property.get('AREA CONSTRUCAO', 'N/A')}")
-                    st.write(f"**Índice Cadastral:** {assigned_property.get('INDICE CADASTRAL', 'N/A')}")
+                        st.markdown("\n\n".join([
+                            f"**Tipo:** {assigned_property.get('TIPO CONSTRUTIVO', 'N/A')}",
+                            f"**Área Terreno:** {assigned_property.get('AREA TERRENO', 'N/A')}",
+                            f"**Área Construção:** {assigned_property.get('AREA CONSTRUCAO', 'N/A')}",
+                        ]))
+                    st.markdown(f"**Índice Cadastral:** {assigned_property.get('INDICE CADASTRAL', 'N/A')}")
                     
                     # Remove assignment button
                     if st.button("🗑️ Remover Atribuição", key="remove_assigned_property"):
@@ -3310,75 +3479,26 @@ with contact_container.container():
 
             # Show original imoveis
             if imoveis:
-                for i, item in enumerate(imoveis):
-                    if not isinstance(item, dict):
-                        continue
-
-                    # Handle both old format (AREA TERRENO) and new format (area_terreno)
-                    area_terreno = item.get("area_terreno") or item.get(
-                        "AREA TERRENO", "?"
-                    )
-                    area_construcao = item.get("area_construcao") or item.get(
-                        "AREA CONSTRUCAO", "?"
-                    )
-                    fraction = item.get("fracao_ideal") or item.get("FRACAO IDEAL", "")
-                    build_type = (
-                        item.get("tipo_construtivo")
-                        or item.get("TIPO CONSTRUTIVO", "").strip()
-                    )
-                    address = item.get("endereco") or item.get("ENDERECO", "?")
-                    neighborhood = item.get("bairro") or item.get("BAIRRO", "?")
-                    indice_cadastral = item.get("indice_cadastral") or item.get(
-                        "INDICE CADASTRAL", ""
-                    )
-
-                    # Format areas
-                    area_terreno_text = fmt_num(area_terreno) if area_terreno else "?"
-                    area_construcao_text = (
-                        fmt_num(area_construcao) if area_construcao else "?"
-                    )
-
-                    # Format fraction
-                    try:
-                        fraction_percent = f"{int(round(float(fraction) * 100 if float(fraction) <= 1 else float(fraction)))}%"
-                    except (ValueError, TypeError):
-                        fraction_percent = str(fraction) if fraction else "N/A"
-
+                for i, (address, neighborhood, property_info) in enumerate(
+                    build_property_cards(imoveis)
+                ):
                     # Create columns for property info and button
                     prop_col1, prop_col2 = st.columns([4, 1])
 
                     with prop_col1:
-                        # Enhanced property display with more information
-                        # Build optional parts separately to avoid nested f-string issues
-                        build_type_part = f" | <em>{build_type}</em>" if build_type else ""
-                        fraction_part = f" | Fração: {fraction_percent}" if fraction_percent != "N/A" else ""
-                        cadastral_part = f"<br><small style='color: #666;'>Cadastro: {indice_cadastral}</small>" if indice_cadastral else ""
-                        
-                        property_info = f"""
-                        <div style="margin-bottom: 10px; padding: 8px; border-left: 3px solid #007bff; background-color: #f8f9fa; border-radius: 4px;">
-                            <strong>{address}, {neighborhood}</strong><br>
-                            <small>Terreno: {area_terreno_text} m² | Construção: {area_construcao_text} m²{build_type_part}{fraction_part}</small>
-                            {cadastral_part}
-                        </div>
-                        """
                         st.markdown(property_info, unsafe_allow_html=True)
 
                     with prop_col2:
                         # Check if there are related conversations for this property
                         try:
-                            related_conversations_df = (
-                                find_conversations_with_same_property(
-                                    address, neighborhood, row.get("conversation_id")
-                                )
-                            )
-                            has_related_conversations = (
-                                not related_conversations_df.empty
+                            has_related_conversations = has_related_property_conversations(
+                                address, neighborhood, row.get("conversation_id")
                             )
 
                             if DEBUG:
                                 if has_related_conversations:
                                     print(
-                                        f"DEBUG: Found {len(related_conversations_df)} related conversations for {address}, {neighborhood}"
+                                        f"DEBUG: Found related conversations for {address}, {neighborhood}"
                                     )
                                 else:
                                     print(
@@ -3419,8 +3539,6 @@ with contact_container.container():
                     unsafe_allow_html=True,
                 )
 
-            st.markdown("</div>", unsafe_allow_html=True)
-
     # ─── COMPREHENSIVE DEBUG INFORMATION ─────────────────────────────────────────
     if DEBUG and debug_info:
         with st.expander("🔍 **Property Mapping Debug Information**", expanded=True):
@@ -3818,14 +3936,14 @@ with sheet_reset_col:
                             # Update master_df with both spreadsheet columns AND mapped database fields
                             for column in fresh_df.columns:
                                 if column in st.session_state.master_df.columns:
-                                    st.session_state.master_df.at[idx, column] = spreadsheet_row[column]
+                                    set_master_value(idx, column, spreadsheet_row[column])
                                     print(f"🔍 TERMINAL DEBUG: Updated {column} = {spreadsheet_row[column]}")  # Terminal debug
                                 
                                 # CRITICAL: Also update the database field name if mapping exists
                                 if column in spreadsheet_to_db_mapping:
                                     db_field = spreadsheet_to_db_mapping[column]
                                     if db_field in st.session_state.master_df.columns:
-                                        st.session_state.master_df.at[idx, db_field] = spreadsheet_row[column]
+                                        set_master_value(idx, db_field, spreadsheet_row[column])
                                         print(f"🔍 TERMINAL DEBUG: Mapped {column} -> {db_field} = {spreadsheet_row[column]}")  # Terminal debug
                             
                             # Reset original values to match spreadsheet (clear pending changes)
@@ -3856,7 +3974,7 @@ with sheet_reset_col:
                                     del st.session_state[key]
                             
                             # Mark as already synced since we're loading from spreadsheet
-                            st.session_state.master_df.at[idx, "sheet_synced"] = True
+                            set_master_value(idx, "sheet_synced", True)
                             
                             # Re-enable auto-sync
                             st.session_state['auto_sync_enabled'] = original_auto_sync
@@ -3892,6 +4010,7 @@ with load_sheet_col:
                 
                 # Update master_df with fresh data
                 st.session_state.master_df = fresh_df
+                clear_related_property_cache()
                 
                 print(f"🔍 TERMINAL DEBUG: Spreadsheet loaded with {len(fresh_df)} conversations")  # Terminal debug
                 if DEV and DEBUG:
@@ -4186,7 +4305,7 @@ with sync_col:
                 operation_id = queue_sync_operation(sync_data, whatsapp_number, "report", essential_fields)
                 
                 # Mark as synced in the dataframe (optimistic update)
-                st.session_state.master_df.at[idx, "sheet_synced"] = True
+                set_master_value(idx, "sheet_synced", True)
                 
                 # Show immediate feedback with more details
                 if len(sync_data) > 0:
@@ -4352,8 +4471,7 @@ try:
         current_time = time.time()
         last_refresh_key = "last_bg_ops_refresh"
         
-        if last_refresh_key not in st.session_state:
-            st.session_state[last_refresh_key] = 0
+        st.session_state.setdefault(last_refresh_key, 0)
         
         # Refresh every 3 seconds when operations are running (only when auto-sync is enabled)
         if (st.session_state.get('auto_sync_enabled', False) and 
@@ -4387,8 +4505,7 @@ try:
                 print("🔄 RESET CLEANUP TIMER: Operations active, preserving context")
         # Auto-refresh every 2 seconds when operations are running
         import time
-        if 'last_operations_refresh' not in st.session_state:
-            st.session_state.last_operations_refresh = 0
+        st.session_state.setdefault("last_operations_refresh", 0)
         
         current_time = time.time()
         time_since_last_refresh = current_time - st.session_state.last_operations_refresh
@@ -4683,7 +4800,7 @@ def show_property_map():
 
     # ─── FOOTER CAPTION ─────────────────────────────────────────────────────────
     st.caption(
-        f"Caso ID: {idx + 1} | WhatsApp: {row.get('whatsapp_number', row.get('phone_number', 'N/A'))} | {datetime.now():%H:%M:%S}"
+        f"Caso ID: {idx + 1} | WhatsApp: {row.get('whatsapp_number', row.get('phone_number', 'N/A'))}"
     )
 
 # ─── PROPERTY ASSIGNMENT POPUP ──────────────────────────────────────────────
@@ -13,7 +13,7 @@ import json
 import duckdb
 
 # Import centralized phone utilities
-from services.phone_utils import clean_phone_for_matching, generate_phone_variants
+from services.phone_utils import clean_phone_for_matching, generate_phone_variants, _digits_only
 
 # Google Drive folder ID for mega_data_set files
 MEGA_DATA_SET_FOLDER_ID = "1yfGnHjmaEOCbrEcYLXaVcW5_bmvzU98l"
@@ -448,8 +448,6 @@ def clean_document_number(documento: str) -> str:
     if not documento or pd.isna(documento):
         return ""
     
-    import re
-    
     # Convert to string and handle floating point numbers
     doc_str = str(documento)
     
@@ -458,7 +456,7 @@ def clean_document_number(documento: str) -> str:
         doc_str = doc_str[:-2]
     
     # Remove all non-numeric characters but preserve leading zeros
-    clean = re.sub(r'[^0-9]', '', doc_str)
+    clean = _digits_only(doc_str)
     
     # Do NOT remove leading zeros - they are part of the CPF format
     # CPF numbers like 00946789606 should remain as 00946789606
@@ -18,6 +18,13 @@ import re
 import pandas as pd
 from typing import Optional, List
 
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+except ImportError:  # pragma: no cover - pandas string ops are used instead
+    pa = None
+    pc = None
+
 
 # Brazilian area codes for validation
 VALID_AREA_CODES = [
@@ -32,6 +39,18 @@ VALID_AREA_CODES = [
     '91', '92', '93', '94', '95', '96', '97', '98', '99'  # Norte
 ]
 
+# Deletes every ASCII character except 0-9 (str.translate runs in C, no regex machinery)
+_NON_DIGITS = str.maketrans('', '', ''.join(chr(c) for c in range(128) if not '0' <= chr(c) <= '9'))
+_NON_DIGITS_RE = re.compile(r'[^0-9]')
+
+
+def _digits_only(text: str) -> str:
+    """Strip everything but 0-9 from text (hot path of every phone helper)."""
+    if text.isascii():
+        return text.translate(_NON_DIGITS)
+    # Non-ASCII input is rare; the table above doesn't cover it
+    return _NON_DIGITS_RE.sub('', text)
+
 
 def normalize_db_to_spreadsheet(phone: str) -> str:
     """
@@ -56,12 +75,12 @@ def normalize_db_to_spreadsheet(phone: str) -> str:
         return ""
     
     # Clean input - remove all non-digits
-    clean = re.sub(r'[^0-9]', '', str(phone))
+    clean = _digits_only(str(phone))
     
     # Remove @domain if present (WhatsApp format)
     if '@' in str(phone):
         clean = str(phone).split('@')[0]
-        clean = re.sub(r'[^0-9]', '', clean)
+        clean = _digits_only(clean)
     
     # Validate DB format: exactly 12 digits
     if len(clean) != 12:
@@ -112,7 +131,7 @@ def normalize_spreadsheet_to_db(phone: str) -> str:
         return ""
     
     # Clean input - remove all non-digits
-    clean = re.sub(r'[^0-9]', '', str(phone))
+    clean = _digits_only(str(phone))
     
     # Validate spreadsheet format: should be 13 digits after cleaning +55
     if len(clean) != 13:
@@ -168,13 +187,12 @@ def clean_phone_for_matching(phone: str) -> str:
         return ""
     
     # Clean input - remove all non-digits and whitespace
-    clean = re.sub(r'[\s\t\n\r]', '', str(phone))
-    clean = re.sub(r'[^0-9]', '', clean)
+    clean = _digits_only(str(phone))
     
     # Remove @domain if present (WhatsApp format)
     if '@' in str(phone):
         clean = str(phone).split('@')[0]
-        clean = re.sub(r'[^0-9]', '', clean)
+        clean = _digits_only(clean)
     
     # Handle edge cases
     if len(clean) < 8:
@@ -185,7 +203,7 @@ def clean_phone_for_matching(phone: str) -> str:
         # Convert to spreadsheet format first, then normalize
         spreadsheet_format = normalize_db_to_spreadsheet(clean)
         if spreadsheet_format.startswith('+'):
-            return re.sub(r'[^0-9]', '', spreadsheet_format)
+            return _digits_only(spreadsheet_format)
         return clean
     
     # Case 2: Spreadsheet format (13 digits after removing +: 55 + area + 9 + phone)
@@ -272,7 +290,7 @@ def format_phone_for_storage(phone: str) -> str:
             return f"'{converted}"
     
     # Default: ensure it starts with +55 and has apostrophe
-    clean = re.sub(r'[^0-9]', '', str(phone))
+    clean = _digits_only(str(phone))
     if len(clean) >= 11:
         # Take last 11 digits and add +55 prefix
         area_and_phone = clean[-11:]
@@ -319,7 +337,7 @@ def format_phone_for_display(phone: str) -> str:
             return f"({area_code}) {mobile_prefix}{phone_number[:4]}-{phone_number[4:]}"
     
     # Fallback: try to extract from raw phone
-    clean = re.sub(r'[^0-9]', '', str(phone))
+    clean = _digits_only(str(phone))
     
     if len(clean) >= 10:
         # Take last 10-11 digits and format
@@ -338,6 +356,83 @@ def format_phone_for_display(phone: str) -> str:
     return phone  # Return original if can't format
 
 
+def format_phones_for_display(phones: pd.Series) -> pd.Series:
+    """
+    Vectorized format_phone_for_display for a whole column.
+
+    DB format (55 + area + 8 digits) and spreadsheet format (55 + area + 9 + 8
+    digits) are formatted with pyarrow.compute kernels in a single pass (pandas
+    string operations when pyarrow is not installed). Any
+    other value falls back to format_phone_for_display, so the result matches
+    the scalar function row for row.
+
+    Args:
+        phones: Series of phones in any format
+
+    Returns:
+        Series of phones formatted for display, aligned with the input index
+
+    Examples:
+        >>> format_phones_for_display(pd.Series(['553191156109', '+5531991156109'])).tolist()
+        ['(31) 99115-6109', '(31) 99115-6109']
+    """
+    text = phones.where(phones.notna(), "").astype(str)
+    if pc is not None:
+        result, fast = _fast_display_arrow(text)
+    else:
+        result, fast = _fast_display_pandas(text)
+    result = pd.Series(result, index=phones.index, dtype=object)
+    fast = pd.Series(fast, index=phones.index)
+
+    slow = ~fast
+    if slow.any():
+        result.loc[slow] = phones.loc[slow].map(format_phone_for_display)
+    return result
+
+
+def _fast_display_arrow(text: pd.Series):
+    """DB/spreadsheet-format display strings via pyarrow.compute (no Python loop)."""
+    arr = pa.array(text, type=pa.string())
+    # Same digits clean_phone_for_matching works on (anything after @ is ignored)
+    digits = pc.list_element(pc.split_pattern(arr, "@", max_splits=1), 0)
+    digits = pc.replace_substring_regex(digits, "[^0-9]", "")
+
+    length = pc.utf8_length(digits)
+    area_code = pc.utf8_slice_codeunits(digits, 2, 4)
+    is_brazilian = pc.starts_with(digits, "55")
+    db_format = pc.and_(
+        pc.and_(is_brazilian, pc.equal(length, 12)),
+        pc.is_in(area_code, value_set=pa.array(VALID_AREA_CODES)),
+    )
+    full_format = pc.and_(is_brazilian, pc.equal(length, 13))
+
+    def part(start, stop):
+        return pc.utf8_slice_codeunits(digits, start, stop)
+
+    # DB format gets the mobile 9 added, exactly like normalize_db_to_spreadsheet
+    db_display = pc.binary_join_element_wise("(", area_code, ") 9", part(4, 8), "-", part(8, 12), "")
+    full_display = pc.binary_join_element_wise("(", area_code, ") ", part(4, 9), "-", part(9, 13), "")
+    result = pc.if_else(full_format, full_display, pc.if_else(db_format, db_display, ""))
+    fast = pc.or_(db_format, full_format)
+    return result.to_numpy(zero_copy_only=False), fast.to_numpy(zero_copy_only=False)
+
+
+def _fast_display_pandas(text: pd.Series):
+    """Fallback for _fast_display_arrow using pandas string operations."""
+    digits = text.str.split("@", n=1).str[0].str.replace(r"[^0-9]", "", regex=True)
+
+    length = digits.str.len()
+    area_code = digits.str[2:4]
+    is_brazilian = digits.str.startswith("55")
+    db_format = is_brazilian & (length == 12) & area_code.isin(VALID_AREA_CODES)
+    full_format = is_brazilian & (length == 13)
+
+    db_display = "(" + area_code + ") 9" + digits.str[4:8] + "-" + digits.str[8:12]
+    full_display = "(" + area_code + ") " + digits.str[4:9] + "-" + digits.str[9:13]
+    result = full_display.where(full_format, db_display).where(db_format | full_format, "")
+    return result.to_numpy(dtype=object), (db_format | full_format).to_numpy()
+
+
 def generate_phone_variants(phone: str) -> List[str]:
     """
     Generate all possible variants of a phone number for matching.
@@ -374,7 +469,7 @@ def generate_phone_variants(phone: str) -> List[str]:
         if len(base_clean) == 12:
             spreadsheet_format = normalize_db_to_spreadsheet(base_clean)
             if spreadsheet_format.startswith('+'):
-                variants.add(re.sub(r'[^0-9]', '', spreadsheet_format))
+                variants.add(_digits_only(spreadsheet_format))
         
         # Add format without country code if present
         if base_clean.startswith('55') and len(base_clean) > 11:
@@ -442,7 +537,7 @@ def debug_phone_conversion(phone: str) -> dict:
         'original': phone,
         'normalized_for_matching': clean_phone_for_matching(phone),
         'db_format': normalize_spreadsheet_to_db(f"+{clean_phone_for_matching(phone)}") if clean_phone_for_matching(phone) else "",
-        'spreadsheet_format': normalize_db_to_spreadsheet(phone) if len(re.sub(r'[^0-9]', '', str(phone))) == 12 else "",
+        'spreadsheet_format': normalize_db_to_spreadsheet(phone) if len(_digits_only(str(phone))) == 12 else "",
         'storage_format': format_phone_for_storage(phone),
         'display_format': format_phone_for_display(phone),
         'variants': generate_phone_variants(phone),
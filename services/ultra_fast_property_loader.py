@@ -13,11 +13,10 @@ import pandas as pd
 import streamlit as st
 import time
 from typing import Dict, List
-import re
 from functools import lru_cache
 
 # Import centralized phone utilities
-from services.phone_utils import clean_phone_for_matching
+from services.phone_utils import clean_phone_for_matching, _digits_only
 
 # Global cache for ultra-fast lookups
 _phone_to_cpf_cache = {}
@@ -56,7 +55,7 @@ class UltraFastPropertyLoader:
             cpf_str = cpf_str[:-2]
         
         # Remove all non-digits but preserve leading zeros
-        clean = re.sub(r'[^0-9]', '', cpf_str)
+        clean = _digits_only(cpf_str)
         
         # Handle CPFs longer than 11 digits - extract last 11 digits
         if len(clean) > 11:
@@ -280,18 +279,24 @@ class UltraFastPropertyLoader:
 # Global ultra-fast loader instance
 _ultra_loader = UltraFastPropertyLoader()
 
-@st.cache_data(ttl=ULTRA_CACHE_DURATION)
 def ultra_fast_batch_load_properties(conversation_data: pd.DataFrame) -> Dict[str, List[Dict]]:
     """
     Ultra-fast batch loading of properties for conversations.
     Expected to be 50x faster than the original implementation.
     """
+    # Extract unique phone numbers from the FILTERED conversations only.
+    # Only this tuple is hashed by the cache, not the whole DataFrame; it is
+    # sorted so the same phone set hits the cache whatever the row order.
+    unique_phones = tuple(sorted(set(conversation_data['phone_number'].dropna()), key=str))
+    return _batch_load_properties_for_phones(unique_phones)
+
+
+@st.cache_data(ttl=ULTRA_CACHE_DURATION)
+def _batch_load_properties_for_phones(unique_phones: tuple) -> Dict[str, List[Dict]]:
+    """Cached body of ultra_fast_batch_load_properties, keyed on the phone set."""
     start_time = time.time()
     
-    print(f"🚀 Starting ultra-fast batch property loading for {len(conversation_data)} conversations...")
-    
-    # Extract unique phone numbers from the FILTERED conversations only
-    unique_phones = conversation_data['phone_number'].dropna().unique().tolist()
+    print(f"🚀 Starting ultra-fast batch property loading for {len(unique_phones)} phone numbers...")
     
     if not unique_phones:
         print("❌ No phone numbers found")
@@ -301,7 +306,7 @@ def ultra_fast_batch_load_properties(conversation_data: pd.DataFrame) -> Dict[st
     
     # Use ultra-fast loader
     global _ultra_loader
-    results = _ultra_loader.get_properties_batch_ultra_fast(unique_phones)
+    results = _ultra_loader.get_properties_batch_ultra_fast(list(unique_phones))
     
     total_time = time.time() - start_time
     total_properties = sum(len(props) for props in results.values())
@@ -0,0 +1,77 @@
+"""Tests for the vectorized phone display formatting in services/phone_utils.py."""
+
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services import phone_utils
+from services.phone_utils import format_phone_for_display, format_phones_for_display
+
+PHONES = [
+    None,
+    np.nan,
+    "",
+    "123",
+    "3199115610",
+    "31991156109",
+    # DB format (no mobile 9) and spreadsheet format
+    "553191156109",
+    "5531991156109",
+    "550091156109",
+    # Already formatted for display
+    "(31) 99115-6109",
+    "+55 (31) 99115-6109",
+    # Mixed separators, WhatsApp ids and surrounding text
+    "+55 31 9 9115-6109",
+    "55.31.9911.56109",
+    "55-31-9115-6109",
+    "5531991156109@s.whatsapp.net",
+    "Tel: 55 31 99115-6109",
+    "55319911561090",
+]
+
+
+@pytest.fixture(params=["arrow", "pandas"])
+def backend(request, monkeypatch):
+    """Run format_phones_for_display with each vectorized backend."""
+    if request.param == "arrow":
+        if phone_utils.pc is None:
+            pytest.skip("pyarrow is not installed")
+    else:
+        monkeypatch.setattr(phone_utils, "pc", None)
+    return request.param
+
+
+def test_vectorized_matches_scalar(backend):
+    phones = pd.Series(PHONES, dtype=object, index=range(10, 10 + len(PHONES)))
+    result = format_phones_for_display(phones)
+    assert result.index.equals(phones.index)
+    assert result.tolist() == [format_phone_for_display(p) for p in PHONES]
+
+
+def test_vectorized_matches_scalar_on_arrow_strings(backend):
+    phones = pd.Series([p for p in PHONES if isinstance(p, str)], dtype="string[pyarrow]")
+    result = format_phones_for_display(phones)
+    assert result.tolist() == [format_phone_for_display(p) for p in phones]
+
+
+@pytest.mark.parametrize("fast_path", ["_fast_display_arrow", "_fast_display_pandas"])
+def test_fast_rows_match_scalar(fast_path):
+    if fast_path == "_fast_display_arrow" and phone_utils.pc is None:
+        pytest.skip("pyarrow is not installed")
+    text = pd.Series(PHONES, dtype=object).where(lambda s: s.notna(), "").astype(str)
+    result, fast = getattr(phone_utils, fast_path)(text)
+    for phone, formatted, is_fast in zip(text, result, fast):
+        if is_fast:
+            assert formatted == format_phone_for_display(phone)
+    assert fast[PHONES.index("553191156109")]
+    assert fast[PHONES.index("+55 31 9 9115-6109")]
+    # Short and malformed numbers are left to the scalar fallback
+    assert not fast[PHONES.index("123")]
+    assert not fast[PHONES.index("550091156109")]
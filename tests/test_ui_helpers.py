@@ -0,0 +1,225 @@
+"""Tests for the text helpers in utils/ui_helpers.py."""
+
+import os
+import random
+import re
+import sys
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+import pytest
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils import ui_helpers
+from utils.ui_helpers import (
+    format_last_message_time,
+    highlight,
+    highlight_pattern,
+    parse_chat,
+    parse_familiares_grouped,
+    proper_case_pt,
+)
+
+
+# ─── proper_case_pt ──────────────────────────────────────────────────────────
+@pytest.mark.parametrize(
+    "raw, expected",
+    [
+        ("maria jose", "Maria Jose"),
+        ("  JOÃO   pedro  ", "João Pedro"),
+        # Only the first letter of each word changes, unlike str.title
+        ("ana (adotiva)", "Ana (adotiva)"),
+        ("1a filha", "1a Filha"),
+        ("d'avila", "D'avila"),
+        # Connectives are lowercased, except as the first word
+        ("MARIA DA SILVA", "Maria da Silva"),
+        ("jose dos santos de oliveira", "Jose dos Santos de Oliveira"),
+        ("das dores", "Das Dores"),
+        ("", ""),
+    ],
+)
+def test_proper_case_pt(raw, expected):
+    assert proper_case_pt(raw) == expected
+
+
+def test_familiares_names_use_proper_case():
+    groups = parse_familiares_grouped("JOSE DA SILVA (filho), ANA DE SOUZA (filha)")
+    assert groups == ["Filho: Jose da Silva", "Filha: Ana de Souza"]
+
+
+# ─── parse_chat ──────────────────────────────────────────────────────────────
+def reference_parse_chat(raw):
+    """The regex-based parse_chat this module shipped with, kept as an oracle."""
+    if not raw:
+        return []
+    chunks = re.split(r"\s*\|\s*|\n(?=\[)", str(raw).strip())
+    msgs = []
+    for part in (c.strip() for c in chunks if c.strip()):
+        m = re.match(r"\[(.*?)\]\s+\((.*?)\):(.*)", part, re.S)
+        if m:
+            ts, sender, msg = m.groups()
+            msgs.append({"ts": ts.strip(), "sender": sender.strip(), "msg": msg.strip()})
+    return msgs
+
+
+CHAT_LOGS = [
+    "",
+    None,
+    # Pipe-separated history
+    "[2024-05-01 10:00:00] (Ana): oi | [2024-05-01 10:01:00] (Bot): olá",
+    "  [10:00] (Ana):oi|[10:01] (Bot):  tudo bem?  ",
+    # Newline-separated history with multi-line messages
+    "[10:00] (Ana): linha 1\nlinha 2\n\n[10:01] (Bot): ok\r\n[10:02] (Ana): fim",
+    # Lines without a timestamp are dropped
+    "sem timestamp\n[10:00] (Ana): oi",
+    "(Ana): sem colchetes | [10:00] (Bot): ok",
+    "[10:00] sem remetente | [10:01] (Bot): ok",
+    # Sender-prefix variants
+    "[10:00](Ana): sem espaço",
+    "[10:00]\t(Ana): tab",
+    "[10:00]\n(Ana): quebra de linha",
+    "[10:00]   (Ana Maria (filha)): parênteses no nome",
+    "[10:00] (): remetente vazio",
+    "[10:00] (Ana):",
+    "[10:00] (Ana) sem dois pontos",
+    "[10:00 (Ana): colchete aberto",
+    "[[10:00]] (Ana): colchetes duplos",
+    "[10:00] (Ana): msg com ] e ( e ): no meio",
+    "||[10:00] (Ana): a||[10:01] (Bot): b|",
+]
+
+
+@pytest.mark.parametrize("raw", CHAT_LOGS)
+def test_parse_chat_matches_reference(raw):
+    assert parse_chat(raw) == reference_parse_chat(raw)
+
+
+def test_parse_chat_memoized_result_is_stable():
+    raw = CHAT_LOGS[4]
+    first = parse_chat(raw)
+    first.append({"ts": "", "sender": "", "msg": "caller-owned list"})
+    assert parse_chat(raw) == reference_parse_chat(raw)
+
+
+def test_parse_chat_matches_reference_on_random_logs():
+    rng = random.Random(1234)
+    alphabet = "[]():| \n\t\rab1"
+    for _ in range(5000):
+        raw = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 40)))
+        assert parse_chat(raw) == reference_parse_chat(raw), repr(raw)
+
+
+# ─── highlight ───────────────────────────────────────────────────────────────
+def reference_highlight(text, names):
+    """The flat longest-first alternation the trie pattern replaced."""
+    names = sorted({n for n in names if n}, key=lambda n: (-len(n), n))
+    pattern = re.compile("|".join(map(re.escape, names)), re.I)
+    return pattern.sub(lambda m: f'<span class="highlighted">{m.group(0)}</span>', text)
+
+
+HIGHLIGHT_NAMES = [
+    "rua", "Rua Nova", "rua nova esperança", "ana", "an", "Ana Maria",
+    "a.b", "c++", "(x)", "[y]", "$1", "a|b", "\\d", "*", "?",
+]
+HIGHLIGHT_TEXTS = [
+    "Moro na RUA NOVA esperança, perto da rua nova e da Rua.",
+    "Ana Maria e ana e Anastácia; an",
+    "a.b axb c++ cc (x) x [y] y $1 1 a|b ab \\d 5 * ?",
+    "rua novo rua nov rua nova esperanç",
+    "",
+]
+
+
+@pytest.fixture
+def highlight_enabled(monkeypatch):
+    monkeypatch.setattr(ui_helpers, "HIGHLIGHT_ENABLE", True)
+
+
+@pytest.mark.parametrize("text", HIGHLIGHT_TEXTS)
+def test_highlight_trie_matches_flat_alternation(highlight_enabled, text):
+    expected = reference_highlight(text, HIGHLIGHT_NAMES)
+    assert highlight(text, HIGHLIGHT_NAMES) == expected
+    assert highlight(text, highlight_pattern(HIGHLIGHT_NAMES)) == expected
+
+
+def test_highlight_prefers_longest_name(highlight_enabled):
+    assert highlight("Rua Nova 12", ["rua", "rua nova"]) == (
+        '<span class="highlighted">Rua Nova</span> 12'
+    )
+
+
+def test_highlight_trie_matches_flat_alternation_on_random_names(highlight_enabled):
+    rng = random.Random(4321)
+    alphabet = "abAB .|*()"
+    for _ in range(2000):
+        names = [
+            "".join(rng.choice(alphabet) for _ in range(rng.randint(1, 5)))
+            for _ in range(rng.randint(1, 6))
+        ]
+        text = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 30)))
+        assert highlight(text, names) == reference_highlight(text, names), (names, text)
+
+
+def test_highlight_disabled_returns_text():
+    assert highlight("rua nova", ["rua"]) == "rua nova"
+
+
+# ─── format_last_message_time ────────────────────────────────────────────────
+def reference_last_message_time(timestamp_str):
+    """strptime-only formatting the slice parser has to agree with."""
+    if not timestamp_str or pd.isna(timestamp_str):
+        return ""
+    clean = str(timestamp_str).strip()
+    if not clean:
+        return ""
+    for fmt in ui_helpers.LAST_MESSAGE_TIME_FORMATS:
+        try:
+            dt = datetime.strptime(clean, fmt)
+        except ValueError:
+            continue
+        return dt.strftime("%d/%b %Hh%Mm%Ss")
+    return clean
+
+
+LAST_MESSAGE_TIMES = [
+    "2024-08-08 14:35:22",
+    "  2024-08-08 14:35:22  ",
+    "2024-08-08T14:35:22",
+    "08/08/2024 14:35:22",
+    "08/08/24 14:35:22",
+    # Not the slice layout: single-digit fields still go through strptime
+    "2024-8-8 4:05:06",
+    # Suffixes and fractions are not in any format and come back unchanged
+    "2024-08-08 14:35:22Z",
+    "2024-08-08T14:35:22+00:00",
+    "2024-08-08 14:35:22-03:00",
+    "2024-08-08 14:35:22.123456",
+    "2024-08-08",
+    # Malformed input falls back to the original text
+    "2024-13-08 14:35:22",
+    "2024-02-30 10:00:00",
+    "2024-08-08 24:00:00",
+    "-024-08-08 14:35:22",
+    "2024/08/08 14:35:22",
+    "2024-08-08 14:35:2x",
+    "２０２４-08-08 14:35:22",
+    "ontem",
+]
+
+
+@pytest.mark.parametrize("raw", LAST_MESSAGE_TIMES)
+def test_format_last_message_time_matches_strptime(raw):
+    assert format_last_message_time(raw) == reference_last_message_time(raw)
+
+
+@pytest.mark.parametrize("raw", [None, np.nan, "", "   "])
+def test_format_last_message_time_empty(raw):
+    assert format_last_message_time(raw) == ""
+
+
+def test_format_last_message_time_output():
+    assert format_last_message_time("2024-08-08 14:35:22") == "08/Aug 14h35m22s"
+    assert format_last_message_time(20240808) == "20240808"
@@ -11,6 +11,11 @@ from typing import Any, Dict, List, Optional
 import pandas as pd
 import streamlit as st
 
+# WKT patterns, compiled once: parse_wkt_multipolygon runs per mapped property
+_WKT_MULTIPOLYGON_RE = re.compile(r"\(\(\(([^)]+(?:\([^)]*\)[^)]*)*)\)\)\)")
+_WKT_POLYGON_RE = re.compile(r"\(\(([^)]+)\)\)")
+_WKT_COORD_RE = re.compile(r"(-?\d+\.?\d*)\s+(-?\d+\.?\d*)")
+
 
 def get_available_map_styles() -> Dict[str, str]:
     """
@@ -48,13 +53,11 @@ def parse_wkt_multipolygon(wkt_string: str) -> List[List[List[float]]]:
         polygons = []
 
         # Find all polygon groups: (((...)))
-        polygon_pattern = r"\(\(\(([^)]+(?:\([^)]*\)[^)]*)*)\)\)\)"
-        polygon_matches = re.findall(polygon_pattern, coords_str)
+        polygon_matches = _WKT_MULTIPOLYGON_RE.findall(coords_str)
 
         if not polygon_matches:
             # Try simpler pattern for single polygon
-            polygon_pattern = r"\(\(([^)]+)\)\)"
-            polygon_matches = re.findall(polygon_pattern, coords_str)
+            polygon_matches = _WKT_POLYGON_RE.findall(coords_str)
 
         for match in polygon_matches:
             # Split coordinate pairs
@@ -79,8 +82,7 @@ def parse_wkt_multipolygon(wkt_string: str) -> List[List[List[float]]]:
         # If still no matches, try direct coordinate extraction
         if not polygons:
             # Extract all coordinate pairs from the string
-            coord_pattern = r"(-?\d+\.?\d*)\s+(-?\d+\.?\d*)"
-            coord_matches = re.findall(coord_pattern, coords_str)
+            coord_matches = _WKT_COORD_RE.findall(coords_str)
 
             if coord_matches:
                 polygon_coords = []
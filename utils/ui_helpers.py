@@ -2,15 +2,21 @@
 
 Shared UI helper functions for the WhatsApp Agent Streamlit app:
 – parsing/fmt for familiares, imóveis, chat
-– text formatting (highlight, bold)
+– text formatting (highlight, bold, last-message times)
 – preset‐response application
 """
 
 import re
 import json
 import ast
+from datetime import datetime
+from functools import lru_cache
 from typing import Any, List, Dict
-from collections import OrderedDict
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 import pandas as pd
 import streamlit as st
@@ -19,24 +25,46 @@ from config import PRESET_RESPONSES
 # toggle highlighting globally
 HIGHLIGHT_ENABLE = False
 
+# Patterns used per rendered row; compiled once at import
+_FAM_SPLIT = re.compile(r",(?![^()]*\))")
+_FAM_NAMEREL = re.compile(r"(.+?)\s+\(([^)]+)\)$")
+_CHAT_LINE = re.compile(r"\[(.*?)\]\s+\((.*?)\):(.*)", re.S)
+_BOLD = re.compile(r"\*([^*]+)\*")
+# Name particles kept lowercase by proper_case_pt
+_PT_CONNECTIVES = frozenset({"da", "das", "de", "do", "dos"})
+
 
+@lru_cache(maxsize=4096)
 def proper_case_pt(txt: str) -> str:
-    """Capitalize each word in Portuguese‐style names."""
-    return " ".join(w.capitalize() for w in txt.split())
+    """
+    Capitalize each word in Portuguese‐style names. Memoized: the same
+    relatives show up across many contacts.
+    """
+    # Connectives stay lowercase except as the first word ("Maria da Silva")
+    return " ".join(
+        w.lower() if i and w.lower() in _PT_CONNECTIVES else w.capitalize()
+        for i, w in enumerate(txt.split())
+    )
 
 
 def parse_familiares_grouped(raw: str) -> List[str]:
     """Turn a raw familiares string into grouped "Rel: name, name" entries."""
-    groups: OrderedDict[str, List[str]] = OrderedDict()
+    return list(_parse_familiares_text(raw or ""))
+
+
+@lru_cache(maxsize=512)
+def _parse_familiares_text(raw: str) -> tuple:
+    """parse_familiares_grouped body, memoized: reruns re-render the same row."""
+    groups: Dict[str, List[str]] = {}  # insertion-ordered
     current = None
-    tokens = re.split(r",(?![^()]*\))", raw or "")
+    tokens = _FAM_SPLIT.split(raw)
     for tok in (t.strip() for t in tokens if t.strip()):
         if ":" in tok:
             rel, name = (p.strip() for p in tok.split(":", 1))
             current = rel.rstrip("sS").capitalize()
             groups.setdefault(current, []).append(proper_case_pt(name))
         else:
-            m = re.match(r"(.+?)\s+\(([^)]+)\)$", tok)
+            m = _FAM_NAMEREL.match(tok)
             if m:
                 name, rel = m.groups()
                 rel = rel.split("(")[0].rstrip("sS").capitalize()
@@ -47,40 +75,94 @@ def parse_familiares_grouped(raw: str) -> List[str]:
                     current = "Outros"
                 groups.setdefault(current, []).append(proper_case_pt(tok))
 
-    return [f"{rel}: {', '.join(names)}" for rel, names in groups.items()]
+    return tuple(f"{rel}: {', '.join(names)}" for rel, names in groups.items())
 
 
 def build_highlights(*names: str) -> List[str]:
     """From several name strings, build a deduped list of words to highlight."""
+    return list(_build_highlights_for(names))
+
+
+@lru_cache(maxsize=512)
+def _build_highlights_for(names: tuple) -> tuple:
+    """build_highlights body, memoized per name tuple (same record on every rerun)."""
     words = []
     for n in names:
         if n:
             words += str(n).split() + [str(n)]
-    return list({w for w in words if len(w) > 1})
+    return tuple({w for w in words if len(w) > 1})
+
+
+def _trie_regex(node: dict) -> str:
+    """Regex for a character trie; shared prefixes are matched only once."""
+    branches = [re.escape(ch) + _trie_regex(child) for ch, child in node.items() if ch]
+    if not branches:
+        return ""
+    body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+    # A name ending here makes the rest optional; greedy ? keeps longest-match
+    return f"(?:{body})?" if "" in node else body
+
+
+@lru_cache(maxsize=256)
+def _compile_highlights(names: tuple) -> "re.Pattern":
+    """One case-insensitive trie-shaped pattern for all names."""
+    trie: Dict[str, dict] = {}
+    for name in names:
+        node = trie
+        for ch in name:
+            node = node.setdefault(ch, {})
+        node[""] = {}
+    return re.compile(_trie_regex(trie), re.I)
+
+
+def highlight_pattern(names: List[str]) -> "re.Pattern | None":
+    """
+    Compile the names from build_highlights into a single pattern, so
+    highlight scans the text once instead of once per name. Names sharing
+    a prefix ("Maria", "Maria De Lourdes") share one trie branch, and the
+    longest name wins at each position.
+    """
+    names = sorted({n.lower() for n in names if n})
+    return _compile_highlights(tuple(names)) if names else None
 
 
-def highlight(text: str, names: List[str]) -> str:
+def highlight(text: str, names: "List[str] | re.Pattern | None") -> str:
     """
     Wrap each occurrence of any name in <span class="highlighted">…</span>.
+    `names` is a list from build_highlights or a pattern from
+    highlight_pattern; matched text keeps its original case.
     Respects the global HIGHLIGHT_ENABLE flag.
     """
     if not HIGHLIGHT_ENABLE or not text:
         return text
 
-    out = str(text)
-    for n in names:
-        out = re.sub(
-            re.escape(n),
-            f'<span class="highlighted">{n}</span>',
-            out,
-            flags=re.I
-        )
-    return out
+    if not isinstance(text, str):
+        text = str(text)
+    pattern = names if isinstance(names, re.Pattern) else highlight_pattern(names or [])
+    if pattern is None:
+        return text
+    return pattern.sub(_wrap_highlighted, text)
+
+
+def _wrap_highlighted(match: "re.Match") -> str:
+    return f'<span class="highlighted">{match.group(0)}</span>'
 
 
 def bold_asterisks(text: str) -> str:
     """Convert *emphasis* into <strong>…</strong> HTML."""
-    return re.sub(r"\*([^*]+)\*", r"<strong>\1</strong>", text)
+    # Most messages have no asterisk: skip the regex and the cache
+    if "*" not in text:
+        return text
+    return _bold_asterisks_text(text)
+
+
+@lru_cache(maxsize=4096)
+def _bold_asterisks_text(text: str) -> str:
+    """
+    bold_asterisks body, memoized: the chat re-renders the same messages
+    on every rerun.
+    """
+    return _BOLD.sub(r"<strong>\1</strong>", text)
 
 
 def parse_chat(raw: str) -> List[Dict[str, str]]:
@@ -90,18 +172,52 @@ def parse_chat(raw: str) -> List[Dict[str, str]]:
     """
     if not raw:
         return []
-    chunks = re.split(r"\s*\|\s*|\n(?=\[)", str(raw).strip())
+    return list(_parse_chat_text(str(raw)))
+
+
+@lru_cache(maxsize=512)
+def _parse_chat_text(raw: str) -> tuple:
+    """
+    parse_chat body, memoized because every rerun of a row re-parses the
+    same history. The message dicts are shared between calls: read only.
+    """
+    # Plain str.split on "|" and then "\n[" yields the same stripped chunks
+    # as the old `\s*\|\s*|\n(?=\[)` regex split, without the regex engine.
+    chunks = []
+    for piece in raw.split("|"):
+        first, *rest = piece.split("\n[")
+        chunks.append(first)
+        chunks.extend("[" + c for c in rest)
     msgs = []
     for part in (c.strip() for c in chunks if c.strip()):
-        m = re.match(r"\[(.*?)\]\s+\((.*?)\):(.*)", part, re.S)
-        if m:
-            ts, sender, msg = m.groups()
+        fields = _split_chat_line(part)
+        if fields:
+            ts, sender, msg = fields
             msgs.append({
                 "ts": ts.strip(),
                 "sender": sender.strip(),
                 "msg": msg.strip()
             })
-    return msgs
+    return tuple(msgs)
+
+
+def _split_chat_line(part: str):
+    """
+    "[ts] (sender): msg" -> (ts, sender, msg) with str.find, or None.
+    Lines the fast path can't vouch for go through _CHAT_LINE, which
+    gives the same result for well-formed lines.
+    """
+    if part.startswith("["):
+        end = part.find("]")
+        start = end + 1
+        while start < len(part) and part[start].isspace():
+            start += 1
+        if end != -1 and start > end + 1 and part.startswith("(", start):
+            close = part.find("):", start + 1)
+            if close != -1:
+                return part[1:end], part[start + 1:close], part[close + 2:]
+    m = _CHAT_LINE.match(part)
+    return m.groups() if m else None
 
 
 def parse_imoveis(raw: Any) -> List[Dict]:
@@ -116,18 +232,41 @@ def parse_imoveis(raw: Any) -> List[Dict]:
     if isinstance(raw, list):
         return raw
     if isinstance(raw, str):
-        for loader in (json.loads, ast.literal_eval):
-            try:
-                result = loader(raw)
-            except (ValueError, SyntaxError):
-                continue
-            if isinstance(result, dict):
-                return [result]
-            if isinstance(result, list):
-                return result
+        return list(_parse_imoveis_text(raw))
     return []
 
 
+# orjson is optional; stdlib json stays as fallback for anything it rejects
+_IMOVEIS_LOADERS = (
+    (orjson.loads, json.loads, ast.literal_eval) if orjson else (json.loads, ast.literal_eval)
+)
+
+
+@lru_cache(maxsize=8192)
+def _parse_imoveis_text(raw: str) -> tuple:
+    """
+    String branch of parse_imoveis, memoized because many rows share the
+    same IMOVEIS blob. The parsed dicts are shared between calls: read only.
+    """
+    text = raw.strip()
+    if text[:1] not in ("[", "{"):
+        # Only a list/dict literal can parse to something usable; skip the
+        # loaders (ast.literal_eval especially) for empty and plain-text values
+        return ()
+    # Python-repr blobs (single quotes only) can never be valid JSON
+    loaders = (ast.literal_eval,) if "'" in text and '"' not in text else _IMOVEIS_LOADERS
+    for loader in loaders:
+        try:
+            result = loader(text)
+        except (ValueError, SyntaxError):
+            continue
+        if isinstance(result, dict):
+            return (result,)
+        if isinstance(result, list):
+            return tuple(result)
+    return ()
+
+
 def fmt_num(v: Any) -> str:
     """Format numbers without unnecessary trailing zeros."""
     if isinstance(v, (int, float)):
@@ -135,6 +274,68 @@ def fmt_num(v: Any) -> str:
     return str(v)
 
 
+# Formats tried, in order, for the last_message_datetime_brt column
+LAST_MESSAGE_TIME_FORMATS = (
+    "%Y-%m-%d %H:%M:%S",    # 2024-08-08 14:35:22
+    "%d/%m/%Y %H:%M:%S",    # 08/08/2024 14:35:22
+    "%Y-%m-%dT%H:%M:%S",    # 2024-08-08T14:35:22
+    "%d/%m/%y %H:%M:%S",    # 08/08/24 14:35:22
+)
+MONTH_ABBR = ("Jan", "Feb", "Mar", "Apr", "May", "Jun",
+              "Jul", "Aug", "Sep", "Oct", "Nov", "Dec")
+
+
+def format_last_message_time(timestamp_str):
+    """Format a last-message timestamp as '08/Aug 14h35m22s'."""
+    if not timestamp_str or pd.isna(timestamp_str) or timestamp_str == '':
+        return ''
+    try:
+        clean_timestamp = str(timestamp_str).strip()
+        if not clean_timestamp:
+            return ''
+        return _format_last_message_text(clean_timestamp)
+    except Exception:
+        return str(timestamp_str)  # Return original if error
+
+
+def _parse_iso_seconds(text: str):
+    """
+    Slice-parse the common 'YYYY-MM-DD HH:MM:SS' layout without strptime.
+    Returns None for anything else, leaving it to the strptime formats.
+    """
+    if (
+        len(text) != 19
+        or text[4] != "-" or text[7] != "-" or text[10] != " "
+        or text[13] != ":" or text[16] != ":"
+    ):
+        return None
+    fields = (text[0:4], text[5:7], text[8:10], text[11:13], text[14:16], text[17:19])
+    if not all(f.isascii() and f.isdigit() for f in fields):
+        return None
+    try:
+        return datetime(*map(int, fields))
+    except ValueError:
+        return None
+
+
+@lru_cache(maxsize=8192)
+def _format_last_message_text(clean_timestamp: str) -> str:
+    """format_last_message_time body, memoized: every rerun re-formats the same column."""
+    dt = _parse_iso_seconds(clean_timestamp)
+    if dt is None:
+        for fmt in LAST_MESSAGE_TIME_FORMATS:
+            try:
+                dt = datetime.strptime(clean_timestamp, fmt)
+                break
+            except ValueError:
+                continue
+
+    if dt is None:
+        return clean_timestamp  # Return original if can't parse
+
+    return f"{dt.day:02d}/{MONTH_ABBR[dt.month - 1]} {dt.hour:02d}h{dt.minute:02d}m{dt.second:02d}s"
+
+
 def apply_preset() -> None:
     """
     Callback for the "Respostas Prontas" selectbox: